@@ -23,6 +23,15 @@ APP_DESCRIPTION = "Persönlicher Finanz-Tracker zur Verwaltung monatlicher Ein-
 APP_TECH = "Python · PySide6 · QtCharts · JSON"
 APP_LICENSE = "MIT License"
 
+# Alignment flags, resolved once instead of per widget
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+
+# Widget stylesheets
+_TITLE_QSS = "color: #4cc9f0;"
+_SEP_QSS = "color: #0f3460;"
+_INFO_LABEL_QSS = "color: #8892b0; font-weight: 600; font-size: 12px;"
+_INFO_VALUE_QSS = "color: #e0e0e0; font-size: 12px;"
+
 
 class AboutDialog(QDialog):
     """About / Info dialog for CashMonitor."""
@@ -41,7 +50,7 @@ class AboutDialog(QDialog):
 
         # ── App Icon / Title ──
         icon_label = QLabel("💰")
-        icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        icon_label.setAlignment(_ALIGN_CENTER)
         icon_font = QFont()
         icon_font.setPointSize(40)
         icon_label.setFont(icon_font)
@@ -49,29 +58,29 @@ class AboutDialog(QDialog):
 
         # App Name
         name_label = QLabel(APP_NAME)
-        name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        name_label.setAlignment(_ALIGN_CENTER)
         name_font = QFont()
         name_font.setPointSize(22)
         name_font.setBold(True)
         name_label.setFont(name_font)
-        name_label.setStyleSheet("color: #4cc9f0;")
+        name_label.setStyleSheet(_TITLE_QSS)
         layout.addWidget(name_label)
 
         # Version
         version_label = QLabel(f"Version {APP_VERSION}")
-        version_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        version_label.setAlignment(_ALIGN_CENTER)
         version_label.setStyleSheet("color: #8892b0; font-size: 13px;")
         layout.addWidget(version_label)
 
         # Separator
         sep = QFrame()
         sep.setFrameShape(QFrame.Shape.HLine)
-        sep.setStyleSheet("color: #0f3460;")
+        sep.setStyleSheet(_SEP_QSS)
         layout.addWidget(sep)
 
         # Description
         desc_label = QLabel(APP_DESCRIPTION)
-        desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        desc_label.setAlignment(_ALIGN_CENTER)
         desc_label.setWordWrap(True)
         desc_label.setStyleSheet("color: #ccd6f6; font-size: 13px; padding: 4px 0;")
         layout.addWidget(desc_label)
@@ -94,7 +103,7 @@ class AboutDialog(QDialog):
 
         # ── Copyright ──
         copy_label = QLabel(f"© {APP_YEAR} {APP_AUTHOR}. Alle Rechte vorbehalten.")
-        copy_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        copy_label.setAlignment(_ALIGN_CENTER)
         copy_label.setStyleSheet("color: #4a5568; font-size: 11px;")
         layout.addWidget(copy_label)
 
@@ -102,11 +111,7 @@ class AboutDialog(QDialog):
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
         close_btn = QPushButton("Schließen")
-        close_btn.setStyleSheet(
-            "QPushButton { background-color: #0f3460; border-color: #4cc9f0; "
-            "color: #4cc9f0; font-weight: bold; padding: 8px 28px; border-radius: 8px; }"
-            "QPushButton:hover { background-color: #16213e; }"
-        )
+        close_btn.setObjectName("closeBtn")
         close_btn.clicked.connect(self.accept)
         btn_layout.addWidget(close_btn)
         btn_layout.addStretch()
@@ -116,10 +121,10 @@ class AboutDialog(QDialog):
     def _info_row(label_text: str, value_text: str) -> QHBoxLayout:
         row = QHBoxLayout()
         label = QLabel(f"{label_text}:")
-        label.setStyleSheet("color: #8892b0; font-weight: 600; font-size: 12px;")
+        label.setStyleSheet(_INFO_LABEL_QSS)
         label.setFixedWidth(100)
         value = QLabel(value_text)
-        value.setStyleSheet("color: #e0e0e0; font-size: 12px;")
+        value.setStyleSheet(_INFO_VALUE_QSS)
         row.addWidget(label)
         row.addWidget(value)
         row.addStretch()
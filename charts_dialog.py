@@ -3,6 +3,10 @@ CashMonitor – Charts / Statistics Dialog
 Multi-month visualizations: bar charts, trends, and category breakdowns.
 """
 
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -14,7 +18,7 @@ from PySide6.QtWidgets import (
     QFrame,
     QSizePolicy,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QPointF
 from PySide6.QtGui import QFont, QColor, QPainter
 from PySide6.QtCharts import (
     QChart,
@@ -48,6 +52,40 @@ CATEGORY_COLORS = [
     "#073b4c", "#e76f51", "#2a9d8f", "#e9c46a", "#264653",
 ]
 
+# Shared colour objects, built once instead of per chart rebuild
+_COL_INCOME = QColor(CHART_COLORS["income"])
+_COL_EXPENSE = QColor(CHART_COLORS["expense"])
+_COL_BALANCE = QColor(CHART_COLORS["balance"])
+_COL_SAVINGS = QColor(CHART_COLORS["savings"])
+_COL_BACKGROUND = QColor("#16213e")
+_COL_TITLE = QColor("#ccd6f6")
+_COL_LABEL = QColor("#8892b0")
+_COL_GRID = QColor("#233554")
+_COL_AXIS_LINE = QColor("#0f3460")
+_COL_SLICE_LABEL = QColor("#e0e0e0")
+_CATEGORY_QCOLORS = [QColor(c) for c in CATEGORY_COLORS]
+
+# Swaps "1,234.56" into German "1.234,56"
+_EU_TRANS = str.maketrans({",": ".", ".": ","})
+
+# Alignment flags, resolved once instead of per widget
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_ALIGN_BOTTOM = Qt.AlignmentFlag.AlignBottom
+_ALIGN_LEFT = Qt.AlignmentFlag.AlignLeft
+
+# Widget stylesheets
+_TITLE_QSS = "color: #4cc9f0;"
+_SEP_QSS = "color: #0f3460;"
+
+
+@lru_cache(maxsize=None)
+def _font(point_size: int, bold: bool = False) -> QFont:
+    """Return a shared QFont (created lazily, QApplication must exist)."""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(bold)
+    return font
+
 
 class ChartsDialog(QDialog):
     """Statistics dialog with multiple chart views."""
@@ -62,6 +100,8 @@ class ChartsDialog(QDialog):
         self.setModal(True)
 
         self._available_months = self.dm.get_available_months()
+        # _month_row() tuples for the real months, filled on first build
+        self._all_data = None
         self._setup_ui()
 
         # Show first chart by default
@@ -79,18 +119,15 @@ class ChartsDialog(QDialog):
         header_layout = QHBoxLayout()
 
         title = QLabel("📊 Statistiken")
-        title_font = QFont()
-        title_font.setPointSize(18)
-        title_font.setBold(True)
-        title.setFont(title_font)
-        title.setStyleSheet("color: #4cc9f0;")
+        title.setFont(_font(18, bold=True))
+        title.setStyleSheet(_TITLE_QSS)
         header_layout.addWidget(title)
 
         header_layout.addStretch()
 
         # Chart selector
         selector_label = QLabel("Diagramm:")
-        selector_label.setStyleSheet("color: #8892b0; font-weight: 600;")
+        selector_label.setObjectName("chartSelectorLabel")
         header_layout.addWidget(selector_label)
 
         self.chart_selector = QComboBox()
@@ -108,9 +145,7 @@ class ChartsDialog(QDialog):
         # Prognose toggle
         self.prognose_check = QCheckBox("Mit Prognose")
         self.prognose_check.setToolTip("Zukuenftige Monate basierend auf Fixeintraegen projizieren")
-        self.prognose_check.setStyleSheet(
-            "QCheckBox { color: #fbbf24; font-weight: 600; margin-left: 12px; }"
-        )
+        self.prognose_check.setObjectName("prognoseCheck")
         self.prognose_check.toggled.connect(self._on_prognose_toggled)
         header_layout.addWidget(self.prognose_check)
 
@@ -119,7 +154,7 @@ class ChartsDialog(QDialog):
         # Separator
         sep = QFrame()
         sep.setFrameShape(QFrame.Shape.HLine)
-        sep.setStyleSheet("color: #0f3460;")
+        sep.setStyleSheet(_SEP_QSS)
         layout.addWidget(sep)
 
         # ── Chart View ──
@@ -127,10 +162,7 @@ class ChartsDialog(QDialog):
         self._style_chart(self.chart)
 
         self.chart_view = QChartView(self.chart)
-        self.chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
-        self.chart_view.setStyleSheet(
-            "background: #16213e; border: 1px solid #0f3460; border-radius: 12px;"
-        )
+        self.chart_view.setObjectName("chartView")
         self.chart_view.setSizePolicy(
             QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
         )
@@ -138,19 +170,15 @@ class ChartsDialog(QDialog):
 
         # ── Info label ──
         self.info_label = QLabel()
-        self.info_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.info_label.setStyleSheet("color: #8892b0; font-size: 12px; padding: 4px;")
+        self.info_label.setAlignment(_ALIGN_CENTER)
+        self.info_label.setObjectName("chartInfoLabel")
         layout.addWidget(self.info_label)
 
         # ── Close button ──
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
         close_btn = QPushButton("Schließen")
-        close_btn.setStyleSheet(
-            "QPushButton { background-color: #0f3460; border-color: #4cc9f0; "
-            "color: #4cc9f0; font-weight: bold; padding: 8px 28px; border-radius: 8px; }"
-            "QPushButton:hover { background-color: #16213e; }"
-        )
+        close_btn.setObjectName("closeBtn")
         close_btn.clicked.connect(self.accept)
         btn_layout.addWidget(close_btn)
         btn_layout.addStretch()
@@ -158,36 +186,56 @@ class ChartsDialog(QDialog):
 
     def _style_chart(self, chart: QChart):
         """Apply consistent dark styling to a chart."""
-        chart.setBackgroundBrush(QColor("#16213e"))
-        chart.setTitleBrush(QColor("#ccd6f6"))
-        title_font = QFont()
-        title_font.setPointSize(13)
-        title_font.setBold(True)
-        chart.setTitleFont(title_font)
-        chart.legend().setLabelColor(QColor("#8892b0"))
-        chart.legend().setAlignment(Qt.AlignmentFlag.AlignBottom)
-        legend_font = QFont()
-        legend_font.setPointSize(10)
-        chart.legend().setFont(legend_font)
-        chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
-
-    def _style_axis(self, axis, color="#8892b0"):
+        chart.setBackgroundBrush(_COL_BACKGROUND)
+        chart.setTitleBrush(_COL_TITLE)
+        chart.setTitleFont(_font(13, bold=True))
+        chart.legend().setLabelColor(_COL_LABEL)
+        chart.legend().setAlignment(_ALIGN_BOTTOM)
+        chart.legend().setFont(_font(10))
+        # Charts are rebuilt on every selector/prognose change; animating each
+        # rebuild only delays the final frame.
+        chart.setAnimationOptions(QChart.AnimationOption.NoAnimation)
+
+    def _set_antialiasing(self, enabled: bool):
+        """Antialias only charts with diagonal/curved edges; bars stay crisp without it."""
+        self.chart_view.setRenderHint(QPainter.RenderHint.Antialiasing, enabled)
+
+    def _style_axis(self, axis, color: QColor = _COL_LABEL):
         """Style an axis for the dark theme."""
-        axis.setLabelsColor(QColor(color))
-        axis.setGridLineColor(QColor("#233554"))
-        axis.setLinePenColor(QColor("#0f3460"))
-        label_font = QFont()
-        label_font.setPointSize(9)
-        axis.setLabelsFont(label_font)
+        axis.setLabelsColor(color)
+        axis.setGridLineColor(_COL_GRID)
+        axis.setLinePenColor(_COL_AXIS_LINE)
+        axis.setLabelsFont(_font(9))
+
+    @staticmethod
+    def _month_row(label: str, sheet: MonthSheet) -> tuple:
+        """Flatten a sheet into (label, income, expense, balance, expense_by_category)."""
+        summary = sheet.summary()
+        return (
+            label,
+            summary.total_income,
+            summary.total_expense,
+            summary.balance,
+            summary.expense_by_category,
+        )
 
     def _load_all_data(self):
-        """Load all available months and optionally project future months."""
+        """
+        Load all available months and optionally project future months.
+        Returns a list of _month_row() tuples, one per month.
+        """
         from datetime import date
-        results = []
-        for year, month in self._available_months:
-            sheet = self.dm.load_month(year, month)
-            label = f"{MONTH_NAMES_SHORT[month]} {year}"
-            results.append((label, sheet))
+        if self._all_data is None:
+            months = self._available_months
+            # Only opening and reading the files overlaps across threads;
+            # JSON parsing holds the GIL, so a few workers are enough
+            with ThreadPoolExecutor(max_workers=max(1, min(4, len(months)))) as pool:
+                sheets = list(pool.map(lambda ym: self.dm.load_month(*ym), months))
+            self._all_data = [
+                self._month_row(f"{MONTH_NAMES_SHORT[month]} {year}", sheet)
+                for (year, month), sheet in zip(months, sheets)
+            ]
+        results = list(self._all_data)
 
         # Add projected future months if prognose is enabled
         if self.prognose_check.isChecked() and self.rm.items:
@@ -217,7 +265,7 @@ class ChartsDialog(QDialog):
                         )
                         proj_sheet.transactions.append(tx)
                     label = f"{MONTH_NAMES_SHORT[m]} {y} *"
-                    results.append((label, proj_sheet))
+                    results.append(self._month_row(label, proj_sheet))
 
         return results
 
@@ -257,25 +305,26 @@ class ChartsDialog(QDialog):
         self.chart.removeAllSeries()
         for axis in self.chart.axes():
             self.chart.removeAxis(axis)
+        self._set_antialiasing(False)
 
         data = self._load_all_data()
         self.chart.setTitle("Einnahmen vs. Ausgaben pro Monat")
 
         income_set = QBarSet("Einnahmen")
-        income_set.setColor(QColor(CHART_COLORS["income"]))
-        income_set.setBorderColor(QColor("#16213e"))
+        income_set.setColor(_COL_INCOME)
+        income_set.setBorderColor(_COL_BACKGROUND)
 
         expense_set = QBarSet("Ausgaben")
-        expense_set.setColor(QColor(CHART_COLORS["expense"]))
-        expense_set.setBorderColor(QColor("#16213e"))
+        expense_set.setColor(_COL_EXPENSE)
+        expense_set.setBorderColor(_COL_BACKGROUND)
 
-        categories = []
-        max_val = 0.0
-        for label, sheet in data:
-            categories.append(label)
-            income_set.append(sheet.total_income)
-            expense_set.append(sheet.total_expense)
-            max_val = max(max_val, sheet.total_income, sheet.total_expense)
+        categories = [row[0] for row in data]
+        income_vals = [row[1] for row in data]
+        expense_vals = [row[2] for row in data]
+        # One append per set instead of one call per month
+        income_set.append(income_vals)
+        expense_set.append(expense_vals)
+        max_val = max(income_vals + expense_vals, default=0.0)
 
         series = QBarSeries()
         series.append(income_set)
@@ -286,7 +335,7 @@ class ChartsDialog(QDialog):
         axis_x = QBarCategoryAxis()
         axis_x.append(categories)
         self._style_axis(axis_x)
-        self.chart.addAxis(axis_x, Qt.AlignmentFlag.AlignBottom)
+        self.chart.addAxis(axis_x, _ALIGN_BOTTOM)
         series.attachAxis(axis_x)
 
         # Y axis
@@ -294,11 +343,11 @@ class ChartsDialog(QDialog):
         axis_y.setRange(0, max_val * 1.15 if max_val > 0 else 100)
         axis_y.setLabelFormat("%.0f €")
         self._style_axis(axis_y)
-        self.chart.addAxis(axis_y, Qt.AlignmentFlag.AlignLeft)
+        self.chart.addAxis(axis_y, _ALIGN_LEFT)
         series.attachAxis(axis_y)
 
-        total_income = sum(s.total_income for _, s in data)
-        total_expense = sum(s.total_expense for _, s in data)
+        total_income = sum(row[1] for row in data)
+        total_expense = sum(row[2] for row in data)
         self.info_label.setText(
             f"Gesamt: Einnahmen {self._fmt(total_income)} · "
             f"Ausgaben {self._fmt(total_expense)} · "
@@ -310,26 +359,24 @@ class ChartsDialog(QDialog):
         self.chart.removeAllSeries()
         for axis in self.chart.axes():
             self.chart.removeAxis(axis)
+        self._set_antialiasing(True)
 
         data = self._load_all_data()
         self.chart.setTitle("Monatliche Bilanz im Verlauf")
 
         series = QLineSeries()
         series.setName("Bilanz")
-        series.setColor(QColor(CHART_COLORS["balance"]))
+        series.setColor(_COL_BALANCE)
         pen = series.pen()
         pen.setWidth(3)
         series.setPen(pen)
 
-        categories = []
-        min_val = 0.0
-        max_val = 0.0
-        for i, (label, sheet) in enumerate(data):
-            categories.append(label)
-            balance = sheet.balance
-            series.append(i, balance)
-            min_val = min(min_val, balance)
-            max_val = max(max_val, balance)
+        categories = [row[0] for row in data]
+        balances = [row[3] for row in data]
+        # Hand Qt the whole point list at once instead of appending per month
+        series.replace([QPointF(i, b) for i, b in enumerate(balances)])
+        min_val = min(balances + [0.0])
+        max_val = max(balances + [0.0])
 
         self.chart.addSeries(series)
 
@@ -337,7 +384,7 @@ class ChartsDialog(QDialog):
         axis_x = QBarCategoryAxis()
         axis_x.append(categories)
         self._style_axis(axis_x)
-        self.chart.addAxis(axis_x, Qt.AlignmentFlag.AlignBottom)
+        self.chart.addAxis(axis_x, _ALIGN_BOTTOM)
         series.attachAxis(axis_x)
 
         # Y axis
@@ -346,10 +393,10 @@ class ChartsDialog(QDialog):
         axis_y.setRange(min_val - margin if min_val - margin < 0 else 0, max_val + margin if max_val > 0 else 100)
         axis_y.setLabelFormat("%.0f €")
         self._style_axis(axis_y)
-        self.chart.addAxis(axis_y, Qt.AlignmentFlag.AlignLeft)
+        self.chart.addAxis(axis_y, _ALIGN_LEFT)
         series.attachAxis(axis_y)
 
-        avg_balance = sum(s.balance for _, s in data) / len(data) if data else 0
+        avg_balance = sum(row[3] for row in data) / len(data) if data else 0
         self.info_label.setText(
             f"Durchschnittliche monatl. Bilanz: {self._fmt(avg_balance)}"
         )
@@ -359,31 +406,26 @@ class ChartsDialog(QDialog):
         self.chart.removeAllSeries()
         for axis in self.chart.axes():
             self.chart.removeAxis(axis)
+        self._set_antialiasing(True)
 
         data = self._load_all_data()
         self.chart.setTitle("Sparquote pro Monat")
 
         series = QLineSeries()
         series.setName("Sparquote (%)")
-        series.setColor(QColor(CHART_COLORS["savings"]))
+        series.setColor(_COL_SAVINGS)
         pen = series.pen()
         pen.setWidth(3)
         series.setPen(pen)
 
-        categories = []
-        max_rate = 0.0
-        min_rate = 0.0
-        rates = []
-        for i, (label, sheet) in enumerate(data):
-            categories.append(label)
-            if sheet.total_income > 0:
-                rate = ((sheet.total_income - sheet.total_expense) / sheet.total_income) * 100
-            else:
-                rate = 0.0
-            rates.append(rate)
-            series.append(i, rate)
-            max_rate = max(max_rate, rate)
-            min_rate = min(min_rate, rate)
+        categories = [row[0] for row in data]
+        rates = [
+            ((income - expense) / income) * 100 if income > 0 else 0.0
+            for _, income, expense, _, _ in data
+        ]
+        series.replace([QPointF(i, rate) for i, rate in enumerate(rates)])
+        max_rate = max(rates + [0.0])
+        min_rate = min(rates + [0.0])
 
         self.chart.addSeries(series)
 
@@ -391,7 +433,7 @@ class ChartsDialog(QDialog):
         axis_x = QBarCategoryAxis()
         axis_x.append(categories)
         self._style_axis(axis_x)
-        self.chart.addAxis(axis_x, Qt.AlignmentFlag.AlignBottom)
+        self.chart.addAxis(axis_x, _ALIGN_BOTTOM)
         series.attachAxis(axis_x)
 
         # Y axis
@@ -399,7 +441,7 @@ class ChartsDialog(QDialog):
         axis_y.setRange(min(min_rate - 10, -10), max(max_rate + 10, 110))
         axis_y.setLabelFormat("%.0f %%")
         self._style_axis(axis_y)
-        self.chart.addAxis(axis_y, Qt.AlignmentFlag.AlignLeft)
+        self.chart.addAxis(axis_y, _ALIGN_LEFT)
         series.attachAxis(axis_y)
 
         avg_rate = sum(rates) / len(rates) if rates else 0
@@ -410,14 +452,15 @@ class ChartsDialog(QDialog):
         self.chart.removeAllSeries()
         for axis in self.chart.axes():
             self.chart.removeAxis(axis)
+        self._set_antialiasing(True)
 
         data = self._load_all_data()
         self.chart.setTitle("Ausgaben nach Kategorie (alle Monate)")
 
         # Aggregate categories
         cats: dict[str, float] = {}
-        for _, sheet in data:
-            for cat, amount in sheet.expense_by_category().items():
+        for *_, month_cats in data:
+            for cat, amount in month_cats.items():
                 cats[cat] = cats.get(cat, 0.0) + amount
 
         if not cats:
@@ -431,8 +474,8 @@ class ChartsDialog(QDialog):
 
         for i, (cat, amount) in enumerate(sorted_cats):
             sl = series.append(f"{cat}: {self._fmt(amount)}", amount)
-            sl.setBrush(QColor(CATEGORY_COLORS[i % len(CATEGORY_COLORS)]))
-            sl.setBorderColor(QColor("#16213e"))
+            sl.setBrush(_CATEGORY_QCOLORS[i % len(_CATEGORY_QCOLORS)])
+            sl.setBorderColor(_COL_BACKGROUND)
             sl.setBorderWidth(2)
 
         if series.count() > 0:
@@ -440,11 +483,8 @@ class ChartsDialog(QDialog):
             biggest.setExploded(True)
             biggest.setExplodeDistanceFactor(0.06)
             biggest.setLabelVisible(True)
-            biggest.setLabelColor(QColor("#e0e0e0"))
-            lf = QFont()
-            lf.setPointSize(10)
-            lf.setBold(True)
-            biggest.setLabelFont(lf)
+            biggest.setLabelColor(_COL_SLICE_LABEL)
+            biggest.setLabelFont(_font(10, bold=True))
 
         self.chart.addSeries(series)
 
@@ -459,52 +499,46 @@ class ChartsDialog(QDialog):
         self.chart.removeAllSeries()
         for axis in self.chart.axes():
             self.chart.removeAxis(axis)
+        self._set_antialiasing(False)
 
         data = self._load_all_data()
         self.chart.setTitle("Top 5 Ausgaben-Kategorien pro Monat")
 
         # Find top 5 categories globally
         global_cats: dict[str, float] = {}
-        for _, sheet in data:
-            for cat, amount in sheet.expense_by_category().items():
+        for *_, month_cats in data:
+            for cat, amount in month_cats.items():
                 global_cats[cat] = global_cats.get(cat, 0.0) + amount
 
-        top5 = [c for c, _ in sorted(global_cats.items(), key=lambda x: x[1], reverse=True)[:5]]
+        top5 = [c for c, _ in heapq.nlargest(5, global_cats.items(), key=lambda x: x[1])]
 
         if not top5:
             self.chart.setTitle("Keine Ausgaben vorhanden")
             self.info_label.setText("")
             return
 
-        bar_sets = {}
-        for i, cat in enumerate(top5):
-            bs = QBarSet(cat)
-            bs.setColor(QColor(CATEGORY_COLORS[i % len(CATEGORY_COLORS)]))
-            bs.setBorderColor(QColor("#16213e"))
-            bar_sets[cat] = bs
-
-        categories = []
-        max_val = 0.0
-        for label, sheet in data:
-            categories.append(label)
-            month_cats = sheet.expense_by_category()
-            month_total = 0.0
-            for cat in top5:
-                val = month_cats.get(cat, 0.0)
-                bar_sets[cat].append(val)
-                month_total += val
-            max_val = max(max_val, month_total)
+        categories = [row[0] for row in data]
+        per_cat_vals = {
+            cat: [month_cats.get(cat, 0.0) for *_, month_cats in data]
+            for cat in top5
+        }
+        month_totals = [sum(vals) for vals in zip(*per_cat_vals.values())]
+        max_val = max(month_totals, default=0.0)
 
         series = QStackedBarSeries()
-        for cat in top5:
-            series.append(bar_sets[cat])
+        for i, cat in enumerate(top5):
+            bs = QBarSet(cat)
+            bs.setColor(_CATEGORY_QCOLORS[i % len(_CATEGORY_QCOLORS)])
+            bs.setBorderColor(_COL_BACKGROUND)
+            bs.append(per_cat_vals[cat])
+            series.append(bs)
         self.chart.addSeries(series)
 
         # X axis
         axis_x = QBarCategoryAxis()
         axis_x.append(categories)
         self._style_axis(axis_x)
-        self.chart.addAxis(axis_x, Qt.AlignmentFlag.AlignBottom)
+        self.chart.addAxis(axis_x, _ALIGN_BOTTOM)
         series.attachAxis(axis_x)
 
         # Y axis
@@ -512,7 +546,7 @@ class ChartsDialog(QDialog):
         axis_y.setRange(0, max_val * 1.15 if max_val > 0 else 100)
         axis_y.setLabelFormat("%.0f €")
         self._style_axis(axis_y)
-        self.chart.addAxis(axis_y, Qt.AlignmentFlag.AlignLeft)
+        self.chart.addAxis(axis_y, _ALIGN_LEFT)
         series.attachAxis(axis_y)
 
         self.info_label.setText(
@@ -523,9 +557,4 @@ class ChartsDialog(QDialog):
 
     @staticmethod
     def _fmt(value: float) -> str:
-        sign = "-" if value < 0 else ""
-        value = abs(value)
-        integer_part = int(value)
-        decimal_part = round((value - integer_part) * 100)
-        int_str = f"{integer_part:,}".replace(",", ".")
-        return f"{sign}{int_str},{decimal_part:02d} €"
+        return f"{value:,.2f} €".translate(_EU_TRANS)
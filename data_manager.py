@@ -3,16 +3,49 @@ CashMonitor – Data Manager
 Handles CRUD operations on monthly JSON transaction files.
 """
 
+import bisect
 import json
 import os
-import uuid
+import re
+import sys
+import threading
+from collections import OrderedDict, defaultdict
 from datetime import datetime, date
 from pathlib import Path
-from typing import Optional
+from operator import attrgetter
+from typing import Callable, Optional
 
-from utils import get_app_dir
+from utils import get_app_dir, read_json, write_json
 
 
+# Number of parsed month sheets DataManager keeps in memory
+_MONTH_CACHE_SIZE = 64
+# Month file names as written by DataManager._file_path
+_MONTH_FILE_RE = re.compile(r"(\d{4})-(\d{2})\.json")
+
+
+def _new_id() -> str:
+    """Random 128-bit hex id (cheaper than formatting a uuid4)."""
+    return os.urandom(16).hex()
+
+
+# Sort key for MonthSheet.transactions, which is kept ordered by date
+_tx_date = attrgetter("date")
+
+
+def _find_index(items: list, index: dict[str, int], item_id: str) -> int:
+    """
+    Return the position of item_id in items, or -1.
+    index maps id -> position and is rebuilt whenever a hit turns out stale,
+    so callers may reorder or replace items without updating it.
+    """
+    i = index.get(item_id)
+    if i is None or i >= len(items) or items[i].id != item_id:
+        index.clear()
+        index.update({item.id: n for n, item in enumerate(items)})
+        i = index.get(item_id, -1)
+    return i
+
 # Default categories
 EXPENSE_CATEGORIES = [
     "Einkauf",
@@ -48,6 +81,17 @@ INCOME_CATEGORIES = [
 class Transaction:
     """Represents a single financial transaction."""
 
+    __slots__ = (
+        "id",
+        "date",
+        "type",
+        "category",
+        "amount_cents",
+        "description",
+        "recurring_id",
+        "is_rollover",
+    )
+
     def __init__(
         self,
         tx_date: str,
@@ -59,26 +103,44 @@ class Transaction:
         recurring_id: Optional[str] = None,
         is_rollover: bool = False,
     ):
-        self.id = tx_id or str(uuid.uuid4())
+        self.id = tx_id or _new_id()
         self.date = tx_date  # "YYYY-MM-DD"
-        self.type = tx_type  # "income" or "expense"
-        self.category = category
-        self.amount = round(amount, 2)
+        # type and category come from small fixed sets; interning shares one
+        # string object per value and makes comparisons identity checks
+        self.type = sys.intern(tx_type)  # "income" or "expense"
+        self.category = sys.intern(category)
+        # Stored as integer cents so sums are exact without re-rounding
+        self.amount_cents = round(amount * 100)
         self.description = description
         self.recurring_id = recurring_id  # links to RecurringItem.id if auto-generated
         self.is_rollover = is_rollover
 
+    @property
+    def amount(self) -> float:
+        return self.amount_cents / 100
+
+    @amount.setter
+    def amount(self, value: float):
+        self.amount_cents = round(value * 100)
+
+    @property
+    def ymd(self) -> tuple[int, int, int]:
+        """Year, month and day of the "YYYY-MM-DD" date."""
+        d = self.date
+        return int(d[:4]), int(d[5:7]), int(d[8:10])
+
     def to_dict(self) -> dict:
         d = {
             "id": self.id,
             "date": self.date,
             "type": self.type,
             "category": self.category,
-            "amount": self.amount,
+            "amount": self.amount_cents / 100,
             "description": self.description,
         }
-        if self.recurring_id:
-            d["recurring_id"] = self.recurring_id
+        recurring_id = self.recurring_id
+        if recurring_id:
+            d["recurring_id"] = recurring_id
         if self.is_rollover:
             d["is_rollover"] = True
         return d
@@ -97,13 +159,95 @@ class Transaction:
         )
 
 
+class MonthSummary:
+    """Aggregated totals of a MonthSheet (shared cache, do not mutate)."""
+
+    __slots__ = (
+        "total_income",
+        "total_expense",
+        "balance",
+        "expense_by_category",
+        "income_by_category",
+        "incomes",
+        "expenses",
+    )
+
+    def __init__(
+        self,
+        total_income: float,
+        total_expense: float,
+        balance: float,
+        expense_by_category: dict[str, float],
+        income_by_category: dict[str, float],
+        incomes: list["Transaction"],
+        expenses: list["Transaction"],
+    ):
+        self.total_income = total_income
+        self.total_expense = total_expense
+        self.balance = balance
+        self.expense_by_category = expense_by_category
+        self.income_by_category = income_by_category
+        self.incomes = incomes
+        self.expenses = expenses
+
+
 class MonthSheet:
     """Represents all transactions for a single month."""
 
+    __slots__ = ("year", "month", "transactions", "_summary", "_id_index")
+
     def __init__(self, year: int, month: int):
         self.year = year
         self.month = month
         self.transactions: list[Transaction] = []
+        # Computed in one pass by _recompute(), dropped by invalidate()
+        self._summary: Optional[MonthSummary] = None
+        self._id_index: dict[str, int] = {}
+
+    def index_of(self, tx_id: str) -> int:
+        """Position of a transaction in ``transactions``, or -1 if absent."""
+        return _find_index(self.transactions, self._id_index, tx_id)
+
+    def invalidate(self) -> None:
+        """Drop cached aggregates; call after mutating ``transactions``."""
+        self._summary = None
+
+    def _recompute(self) -> MonthSummary:
+        """Compute totals and category sums in a single pass over transactions."""
+        # Sums run on integer cents and are converted to euros at the end
+        income_cents = 0
+        expense_cents = 0
+        expense_cats: defaultdict[str, int] = defaultdict(int)
+        income_cats: defaultdict[str, int] = defaultdict(int)
+        incomes: list[Transaction] = []
+        expenses: list[Transaction] = []
+        for t in self.transactions:
+            tx_type = t.type
+            cents = t.amount_cents
+            if tx_type == "income":
+                income_cents += cents
+                income_cats[t.category] += cents
+                incomes.append(t)
+            elif tx_type == "expense":
+                expense_cents += cents
+                expense_cats[t.category] += cents
+                expenses.append(t)
+        self._summary = MonthSummary(
+            total_income=income_cents / 100,
+            total_expense=expense_cents / 100,
+            balance=(income_cents - expense_cents) / 100,
+            expense_by_category={k: v / 100 for k, v in expense_cats.items()},
+            income_by_category={k: v / 100 for k, v in income_cats.items()},
+            incomes=incomes,
+            expenses=expenses,
+        )
+        return self._summary
+
+    def summary(self) -> MonthSummary:
+        """All month aggregates at once, recomputed only after invalidate()."""
+        if self._summary is None:
+            return self._recompute()
+        return self._summary
 
     @property
     def month_key(self) -> str:
@@ -111,54 +255,70 @@ class MonthSheet:
 
     @property
     def incomes(self) -> list[Transaction]:
-        return [t for t in self.transactions if t.type == "income"]
+        """Income transactions in list order (cached, do not mutate)."""
+        return self.summary().incomes
 
     @property
     def expenses(self) -> list[Transaction]:
-        return [t for t in self.transactions if t.type == "expense"]
+        """Expense transactions in list order (cached, do not mutate)."""
+        return self.summary().expenses
 
     @property
     def total_income(self) -> float:
-        return round(sum(t.amount for t in self.incomes), 2)
+        return self.summary().total_income
 
     @property
     def total_expense(self) -> float:
-        return round(sum(t.amount for t in self.expenses), 2)
+        return self.summary().total_expense
 
     @property
     def balance(self) -> float:
-        return round(self.total_income - self.total_expense, 2)
+        return self.summary().balance
 
     def expense_by_category(self) -> dict[str, float]:
-        cats: dict[str, float] = {}
-        for t in self.expenses:
-            cats[t.category] = round(cats.get(t.category, 0.0) + t.amount, 2)
-        return cats
+        """Expense totals per category (cached, do not mutate the result)."""
+        return self.summary().expense_by_category
 
     def income_by_category(self) -> dict[str, float]:
-        cats: dict[str, float] = {}
-        for t in self.incomes:
-            cats[t.category] = round(cats.get(t.category, 0.0) + t.amount, 2)
-        return cats
+        """Income totals per category (cached, do not mutate the result)."""
+        return self.summary().income_by_category
 
     def to_dict(self) -> dict:
+        to_dict = Transaction.to_dict
         return {
             "month": self.month_key,
-            "transactions": [t.to_dict() for t in self.transactions],
+            "transactions": [to_dict(t) for t in self.transactions],
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "MonthSheet":
         parts = data["month"].split("-")
         sheet = cls(int(parts[0]), int(parts[1]))
+        # Same as Transaction.from_dict, inlined for the bulk load path
+        tx = Transaction
         sheet.transactions = [
-            Transaction.from_dict(t) for t in data.get("transactions", [])
+            tx(
+                t["date"],
+                t["type"],
+                t["category"],
+                t["amount"],
+                t.get("description", ""),
+                t.get("id"),
+                t.get("recurring_id"),
+                t.get("is_rollover", False),
+            )
+            for t in data.get("transactions", [])
         ]
+        sheet.invalidate()
         return sheet
 
 
 class DataManager:
-    """Manages loading/saving of monthly JSON sheets."""
+    """
+    Manages loading/saving of monthly JSON sheets.
+    save_month() only queues a sheet; flush() writes queued sheets. Without
+    an on_dirty callback every save is flushed immediately.
+    """
 
     def __init__(self, data_dir: Optional[str] = None):
         if data_dir is None:
@@ -166,81 +326,260 @@ class DataManager:
         else:
             self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        # "YYYY-MM" -> {category: expense cents}, loaded on first use
+        self._category_index: Optional[dict[str, dict[str, int]]] = None
+        # "YYYY-MM" -> mtime_ns of the month file the index entry was built
+        # from; entries whose file changed since are recomputed
+        self._index_mtimes: dict[str, int] = {}
+        # (year, month) -> (file mtime_ns, sheet), least recently used first.
+        # Guarded by a lock because the charts dialog loads months in threads.
+        self._month_cache: OrderedDict[tuple[int, int], tuple[int, MonthSheet]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Months with a file on disk; scanned once, extended by save_month
+        self._known_months: Optional[set[tuple[int, int]]] = None
+        # Sheets saved but not yet written, see flush()
+        self._pending: dict[tuple[int, int], MonthSheet] = {}
+        self._index_dirty = False
+        # Called instead of flushing when a save is queued (e.g. to start a timer)
+        self.on_dirty: Optional[Callable[[], None]] = None
+
+    @property
+    def _index_path(self) -> Path:
+        return self.data_dir / "category_index.json"
 
     def _file_path(self, year: int, month: int) -> Path:
         return self.data_dir / f"{year:04d}-{month:02d}.json"
 
     def load_month(self, year: int, month: int) -> MonthSheet:
         """Load a monthly sheet from JSON. Creates empty sheet if file doesn't exist."""
+        key = (year, month)
+        with self._cache_lock:
+            pending = self._pending.get(key)
+        if pending is not None:
+            return pending
         path = self._file_path(year, month)
-        if path.exists():
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return MonthSheet.from_dict(data)
-        return MonthSheet(year, month)
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return MonthSheet(year, month)
+        with self._cache_lock:
+            cached = self._month_cache.get(key)
+            if cached is not None and cached[0] == mtime:
+                self._month_cache.move_to_end(key)
+                return cached[1]
+        sheet = MonthSheet.from_dict(read_json(path))
+        self._cache_month(sheet, mtime)
+        return sheet
+
+    def read_month_copy(self, year: int, month: int) -> MonthSheet:
+        """
+        Read a monthly sheet from disk into a new object, bypassing the caches.
+        Safe to use from a worker thread; call flush() first so the file
+        contains all pending changes.
+        """
+        try:
+            data = read_json(self._file_path(year, month))
+        except FileNotFoundError:
+            return MonthSheet(year, month)
+        return MonthSheet.from_dict(data)
+
+    def _cache_month(self, sheet: MonthSheet, mtime: int) -> None:
+        key = (sheet.year, sheet.month)
+        with self._cache_lock:
+            self._month_cache[key] = (mtime, sheet)
+            self._month_cache.move_to_end(key)
+            if len(self._month_cache) > _MONTH_CACHE_SIZE:
+                self._month_cache.popitem(last=False)
 
     def save_month(self, sheet: MonthSheet) -> None:
-        """Save a monthly sheet to JSON."""
-        path = self._file_path(sheet.year, sheet.month)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(sheet.to_dict(), f, ensure_ascii=False, indent=2)
+        """Queue a monthly sheet for saving to JSON (see flush)."""
+        key = (sheet.year, sheet.month)
+        index = self._ensure_index(validate=False)
+        index[sheet.month_key] = self._expense_cents_by_category(sheet)
+        # The file no longer matches this entry; flush records the new mtime
+        self._index_mtimes.pop(sheet.month_key, None)
+        self._index_dirty = True
+        self._months().add(key)
+        with self._cache_lock:
+            self._pending[key] = sheet
+        if self.on_dirty is None:
+            self.flush()
+        else:
+            self.on_dirty()
+
+    def flush(self) -> None:
+        """Write all queued month sheets and the category index."""
+        with self._cache_lock:
+            pending = list(self._pending.items())
+        for key, sheet in pending:
+            path = self._file_path(sheet.year, sheet.month)
+            write_json(path, sheet.to_dict())
+            mtime = path.stat().st_mtime_ns
+            # Dequeue only once written, so a failed flush is retried
+            with self._cache_lock:
+                if self._pending.get(key) is sheet:
+                    del self._pending[key]
+            self._cache_month(sheet, mtime)
+            # Written after the month files: if the process dies in between,
+            # the stored mtimes no longer match and _ensure_index recomputes
+            self._index_mtimes[sheet.month_key] = mtime
+        if self._index_dirty:
+            self._write_index()
+
+    def _has_month(self, year: int, month: int) -> bool:
+        return (year, month) in self._pending or self._file_path(year, month).exists()
 
     def add_transaction(self, sheet: MonthSheet, transaction: Transaction) -> None:
         """Add a transaction to a sheet and save."""
-        sheet.transactions.append(transaction)
-        # Sort by date
-        sheet.transactions.sort(key=lambda t: t.date)
+        # Keep the list sorted by date (inserted after equal dates)
+        bisect.insort(sheet.transactions, transaction, key=_tx_date)
+        sheet.invalidate()
         self.save_month(sheet)
 
     def delete_transaction(self, sheet: MonthSheet, tx_id: str) -> bool:
         """Delete a transaction by ID. Returns True if found and deleted."""
-        for i, t in enumerate(sheet.transactions):
-            if t.id == tx_id:
-                sheet.transactions.pop(i)
-                self.save_month(sheet)
-                return True
-        return False
+        i = sheet.index_of(tx_id)
+        if i < 0:
+            return False
+        sheet.transactions.pop(i)
+        sheet.invalidate()
+        self.save_month(sheet)
+        return True
 
     def update_transaction(
         self, sheet: MonthSheet, tx_id: str, updated: Transaction
     ) -> bool:
         """Update a transaction by ID. Returns True if found and updated."""
-        for i, t in enumerate(sheet.transactions):
-            if t.id == tx_id:
-                updated.id = tx_id
-                sheet.transactions[i] = updated
-                sheet.transactions.sort(key=lambda t: t.date)
-                self.save_month(sheet)
-                return True
-        return False
+        i = sheet.index_of(tx_id)
+        if i < 0:
+            return False
+        updated.id = tx_id
+        if updated.date == sheet.transactions[i].date:
+            sheet.transactions[i] = updated
+        else:
+            sheet.transactions.pop(i)
+            bisect.insort(sheet.transactions, updated, key=_tx_date)
+        sheet.invalidate()
+        self.save_month(sheet)
+        return True
 
     def get_available_months(self) -> list[tuple[int, int]]:
         """Return a sorted list of (year, month) tuples for which data exists."""
-        months = []
-        for f in self.data_dir.glob("*.json"):
-            if f.stem == "recurring":
+        return sorted(self._months())
+
+    def _months(self) -> set[tuple[int, int]]:
+        if self._known_months is None:
+            months = set()
+            with os.scandir(self.data_dir) as entries:
+                for entry in entries:
+                    m = _MONTH_FILE_RE.fullmatch(entry.name)
+                    if m:
+                        months.add((int(m[1]), int(m[2])))
+            self._known_months = months
+        return self._known_months
+
+    def get_total_expenses_for_category(self, category: str) -> float:
+        """Calculate total expenses for a given category across all available months."""
+        # Exact category match: a goal "Sparen: Japan" counts expenses
+        # booked under "Sparen: Japan".
+        index = self._ensure_index()
+        total_cents = sum(cats.get(category, 0) for cats in index.values())
+        return total_cents / 100
+
+    def get_expense_totals_by_category(self) -> dict[str, float]:
+        """Calculate total expenses per category across all available months."""
+        totals: defaultdict[str, int] = defaultdict(int)
+        for cats in self._ensure_index().values():
+            for category, cents in cats.items():
+                totals[category] += cents
+        return {category: cents / 100 for category, cents in totals.items()}
+
+    @staticmethod
+    def _expense_cents_by_category(sheet: MonthSheet) -> dict[str, int]:
+        totals: defaultdict[str, int] = defaultdict(int)
+        for tx in sheet.expenses:
+            totals[tx.category] += tx.amount_cents
+        return dict(totals)
+
+    def _ensure_index(self, validate: bool = True) -> dict[str, dict[str, int]]:
+        """
+        Return the category index, loading it on first use.
+        With validate, entries whose month file was changed, restored or
+        removed outside the app since they were computed are recomputed.
+        """
+        if self._category_index is None:
+            index, mtimes = {}, {}
+            if self._index_path.exists():
+                try:
+                    data = read_json(self._index_path)
+                except (ValueError, OSError):
+                    data = None
+                # Files without stored mtimes predate validation and are rebuilt
+                if (
+                    isinstance(data, dict)
+                    and isinstance(data.get("categories"), dict)
+                    and isinstance(data.get("mtimes"), dict)
+                ):
+                    index, mtimes = data["categories"], data["mtimes"]
+            self._category_index = index
+            self._index_mtimes = mtimes
+            validate = True
+        if validate:
+            self._sync_index()
+        return self._category_index
+
+    def _sync_index(self) -> None:
+        """Recompute index entries that do not match their month file."""
+        index = self._category_index
+        mtimes = self._index_mtimes
+        with self._cache_lock:
+            pending = {f"{y:04d}-{m:02d}" for y, m in self._pending}
+        expected = {f"{y:04d}-{m:02d}": (y, m) for y, m in self._months()}
+        changed = False
+        for key in [k for k in index if k not in expected]:
+            del index[key]
+            mtimes.pop(key, None)
+            changed = True
+        for key, (y, m) in expected.items():
+            # Queued sheets are newer than their file; flush records them
+            if key in pending:
                 continue
             try:
-                parts = f.stem.split("-")
-                months.append((int(parts[0]), int(parts[1])))
-            except (ValueError, IndexError):
+                mtime = self._file_path(y, m).stat().st_mtime_ns
+            except FileNotFoundError:
+                if index.pop(key, None) is not None:
+                    mtimes.pop(key, None)
+                    changed = True
+                continue
+            if key in index and mtimes.get(key) == mtime:
                 continue
-        return sorted(months)
+            try:
+                cats = self._expense_cents_by_category(self.load_month(y, m))
+            except (ValueError, KeyError, TypeError, OSError):
+                # Unreadable month: leave it out and try again next time
+                index.pop(key, None)
+                mtimes.pop(key, None)
+                continue
+            index[key] = cats
+            mtimes[key] = mtime
+            changed = True
+        if changed:
+            self._write_index()
+
+    def _write_index(self) -> None:
+        write_json(
+            self._index_path,
+            {"mtimes": self._index_mtimes, "categories": self._category_index},
+        )
+        self._index_dirty = False
 
-    def get_total_expenses_for_category(self, category: str) -> float:
-        """Calculate total expenses for a given category across all available months."""
-        total = 0.0
-        for year, month in self.get_available_months():
-            sheet = self.load_month(year, month)
-            # Find expenses with this category
-            # Note: Category matching should be exact or startswith?
-            # User might use "Sparen: Urlaub" vs "Urlaub".
-            # Let's assume exact match for now, or maybe the goal IS the category.
-            # "Sparen: Japan" -> Category is "Sparen: Japan".
-            for tx in sheet.expenses:
-                if tx.category == category:
-                    total += tx.amount
-        return round(total, 2)
+    def rebuild_index(self) -> dict[str, dict[str, int]]:
+        """Recompute the category index from all month files and store it."""
+        self._category_index = {}
+        self._index_mtimes = {}
+        self._sync_index()
+        self._write_index()
+        return self._category_index
 
     def _get_previous_month(self, year: int, month: int) -> tuple[int, int]:
         """Return the previous month as (year, month)."""
@@ -251,48 +590,52 @@ class DataManager:
     def update_rollover(self, sheet: MonthSheet):
         """Calculate previous month's balance and insert/update rollover transaction."""
         prev_year, prev_month = self._get_previous_month(sheet.year, sheet.month)
-        
-        available = self.get_available_months()
-        if (prev_year, prev_month) not in available:
-            # No previous data -> Remove any existing rollover
-            self._remove_rollover(sheet)
-            self.save_month(sheet)
+
+        desired = None
+        # No previous data -> no rollover
+        if self._has_month(prev_year, prev_month):
+            balance = self.load_month(prev_year, prev_month).balance
+            if abs(balance) > 0.001:
+                # Rollover is always on the 1st of the month
+                desired = Transaction(
+                    tx_date=f"{sheet.year:04d}-{sheet.month:02d}-01",
+                    tx_type="income" if balance > 0 else "expense",
+                    category="Startguthaben" if balance > 0 else "Vorjahresdefizit",
+                    amount=abs(balance),
+                    description=f"Übertrag aus {prev_year:04d}-{prev_month:02d}",
+                    is_rollover=True
+                )
+
+        # Rollover sits at the top, so this normally stops at the first entry
+        existing = next((t for t in sheet.transactions if t.is_rollover), None)
+        if desired is None:
+            if existing is None:
+                return
+        elif existing is not None and (
+            existing.date == desired.date
+            and existing.type == desired.type
+            and existing.amount_cents == desired.amount_cents
+            and existing.description == desired.description
+        ):
+            # Already up to date, skip rewriting the month file
             return
 
-        # Load real data
-        prev_sheet = self.load_month(prev_year, prev_month)
-        
-        balance = prev_sheet.balance
-        
-        # Remove old rollover
         self._remove_rollover(sheet)
-        
-        if abs(balance) > 0.001:
-            # Create new rollover
-            tx_type = "income" if balance > 0 else "expense"
-            # Rollover is always on the 1st of the month
-            tx_date = f"{sheet.year:04d}-{sheet.month:02d}-01"
-            
-            tx = Transaction(
-                tx_date=tx_date,
-                tx_type=tx_type,
-                category="Startguthaben" if balance > 0 else "Vorjahresdefizit",
-                amount=abs(balance),
-                description=f"Übertrag aus {prev_year:04d}-{prev_month:02d}",
-                is_rollover=True
-            )
-            sheet.transactions.insert(0, tx) # Put at top
-        
+        if desired is not None:
+            sheet.transactions.insert(0, desired) # Put at top
+        sheet.invalidate()
         self.save_month(sheet)
 
     def _remove_rollover(self, sheet: MonthSheet):
         """Remove any transaction marked as rollover."""
-        sheet.transactions = [t for t in sheet.transactions if not getattr(t, 'is_rollover', False)]
+        sheet.transactions = [t for t in sheet.transactions if not t.is_rollover]
 
 
 class RecurringItem:
     """A recurring transaction template."""
 
+    __slots__ = ("id", "day", "type", "category", "amount", "description", "active")
+
     def __init__(
         self,
         day: int,
@@ -303,7 +646,7 @@ class RecurringItem:
         item_id: Optional[str] = None,
         active: bool = True,
     ):
-        self.id = item_id or str(uuid.uuid4())
+        self.id = item_id or _new_id()
         self.day = min(max(day, 1), 28)  # clamp to 1-28
         self.type = tx_type
         self.category = category
@@ -341,6 +684,10 @@ class RecurringManager:
     def __init__(self, data_dir: Path):
         self.data_dir = data_dir
         self.items: list[RecurringItem] = []
+        self._id_index: dict[str, int] = {}
+        self._dirty = False
+        # Called instead of saving right away when items change, see flush()
+        self.on_dirty: Optional[Callable[[], None]] = None
         self._load()
 
     @property
@@ -349,8 +696,7 @@ class RecurringManager:
 
     def _load(self):
         if self._file_path.exists():
-            with open(self._file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = read_json(self._file_path)
             self.items = [
                 RecurringItem.from_dict(r) for r in data.get("recurring", [])
             ]
@@ -359,37 +705,56 @@ class RecurringManager:
 
     def _save(self):
         data = {"recurring": [item.to_dict() for item in self.items]}
-        with open(self._file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        write_json(self._file_path, data)
+
+    def _mark_dirty(self):
+        self._dirty = True
+        if self.on_dirty is None:
+            self.flush()
+        else:
+            self.on_dirty()
+
+    def flush(self):
+        """
+        Write pending changes to recurring.json. On OSError the changes stay
+        pending and the next flush() retries them.
+        """
+        if self._dirty:
+            self._save()
+            self._dirty = False
+
+    def get(self, item_id: str) -> Optional[RecurringItem]:
+        i = _find_index(self.items, self._id_index, item_id)
+        return self.items[i] if i >= 0 else None
 
     def add(self, item: RecurringItem):
         self.items.append(item)
-        self._save()
+        self._mark_dirty()
 
     def delete(self, item_id: str) -> bool:
-        for i, item in enumerate(self.items):
-            if item.id == item_id:
-                self.items.pop(i)
-                self._save()
-                return True
-        return False
+        i = _find_index(self.items, self._id_index, item_id)
+        if i < 0:
+            return False
+        self.items.pop(i)
+        self._mark_dirty()
+        return True
 
     def update(self, item_id: str, updated: RecurringItem) -> bool:
-        for i, item in enumerate(self.items):
-            if item.id == item_id:
-                updated.id = item_id
-                self.items[i] = updated
-                self._save()
-                return True
-        return False
+        i = _find_index(self.items, self._id_index, item_id)
+        if i < 0:
+            return False
+        updated.id = item_id
+        self.items[i] = updated
+        self._mark_dirty()
+        return True
 
     def toggle_active(self, item_id: str) -> bool:
-        for item in self.items:
-            if item.id == item_id:
-                item.active = not item.active
-                self._save()
-                return True
-        return False
+        item = self.get(item_id)
+        if item is None:
+            return False
+        item.active = not item.active
+        self._mark_dirty()
+        return True
 
     def apply_recurring(self, sheet: MonthSheet, dm: "DataManager"):
         """Apply all active recurring items to a month sheet if not already present."""
@@ -397,39 +762,43 @@ class RecurringManager:
             t.recurring_id for t in sheet.transactions if t.recurring_id
         }
 
-        added = False
-        for item in self.items:
-            if not item.active:
-                continue
-            if item.id in existing_recurring_ids:
-                continue
-
-            # For current month: only apply if day <= today
-            today = date.today()
-            if sheet.year == today.year and sheet.month == today.month:
-                if item.day > today.day:
-                    continue
+        # For current month: only apply items whose day has been reached
+        today = date.today()
+        if sheet.year == today.year and sheet.month == today.month:
+            max_day = today.day
+        else:
+            max_day = 31
+        to_apply = [
+            item for item in self.items
+            if item.active
+            and item.day <= max_day
+            and item.id not in existing_recurring_ids
+        ]
+        if not to_apply:
+            return
 
-            tx_date = f"{sheet.year:04d}-{sheet.month:02d}-{item.day:02d}"
-            tx = Transaction(
-                tx_date=tx_date,
+        prefix = f"{sheet.year:04d}-{sheet.month:02d}-"
+        sheet.transactions.extend(
+            Transaction(
+                tx_date=f"{prefix}{item.day:02d}",
                 tx_type=item.type,
                 category=item.category,
                 amount=item.amount,
                 description=item.description,
                 recurring_id=item.id,
             )
-            sheet.transactions.append(tx)
-            added = True
-
-        if added:
-            sheet.transactions.sort(key=lambda t: t.date)
-            dm.save_month(sheet)
+            for item in to_apply
+        )
+        sheet.transactions.sort(key=_tx_date)
+        sheet.invalidate()
+        dm.save_month(sheet)
 
 
 class SavingsGoal:
     """A savings goal linked to a specific category."""
 
+    __slots__ = ("id", "name", "target_amount", "category", "icon", "color")
+
     def __init__(
         self,
         name: str,
@@ -439,7 +808,7 @@ class SavingsGoal:
         color: str = "#10b981",
         goal_id: Optional[str] = None,
     ):
-        self.id = goal_id or str(uuid.uuid4())
+        self.id = goal_id or _new_id()
         self.name = name
         self.target_amount = target_amount
         self.category = category
@@ -478,41 +847,62 @@ class SavingsManager:
             self.file_path = data_dir / "savings.json"
         
         self.goals: list[SavingsGoal] = []
+        self._id_index: dict[str, int] = {}
+        self._dirty = False
+        # Called instead of saving right away when goals change, see flush()
+        self.on_dirty: Optional[Callable[[], None]] = None
         self._load()
 
     def _load(self):
         if not self.file_path.exists():
             return
         try:
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.goals = [SavingsGoal.from_dict(item) for item in data.get("goals", [])]
+            data = read_json(self.file_path)
+            self.goals = [SavingsGoal.from_dict(item) for item in data.get("goals", [])]
         except (json.JSONDecodeError, OSError):
             self.goals = []
 
     def _save(self):
         data = {"goals": [g.to_dict() for g in self.goals]}
-        try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-        except OSError:
-            pass
+        write_json(self.file_path, data)
+
+    def _mark_dirty(self):
+        self._dirty = True
+        if self.on_dirty is None:
+            self.flush()
+        else:
+            self.on_dirty()
+
+    def flush(self):
+        """
+        Write pending changes to savings.json. On OSError the changes stay
+        pending and the next flush() retries them.
+        """
+        if self._dirty:
+            self._save()
+            self._dirty = False
+
+    def get(self, goal_id: str) -> Optional[SavingsGoal]:
+        i = _find_index(self.goals, self._id_index, goal_id)
+        return self.goals[i] if i >= 0 else None
 
     def add(self, goal: SavingsGoal):
         self.goals.append(goal)
-        self._save()
+        self._mark_dirty()
 
     def update(self, goal_id: str, updated: SavingsGoal) -> bool:
-        for i, g in enumerate(self.goals):
-            if g.id == goal_id:
-                updated.id = goal_id
-                self.goals[i] = updated
-                self._save()
-                return True
-        return False
+        i = _find_index(self.goals, self._id_index, goal_id)
+        if i < 0:
+            return False
+        updated.id = goal_id
+        self.goals[i] = updated
+        self._mark_dirty()
+        return True
 
     def delete(self, goal_id: str):
-        self.goals = [g for g in self.goals if g.id != goal_id]
-        self._save()
+        i = _find_index(self.goals, self._id_index, goal_id)
+        if i >= 0:
+            self.goals.pop(i)
+            self._mark_dirty()
 
 
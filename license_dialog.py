@@ -41,10 +41,7 @@ class LicenseDialog(QDialog):
         layout.addWidget(info)
 
         btn_load = QPushButton("📂 Lizenzdatei laden...")
-        btn_load.setStyleSheet(
-            "QPushButton { background-color: #0f3460; color: #4cc9f0; padding: 10px; font-weight: bold; border-radius: 5px; }"
-            "QPushButton:hover { background-color: #16213e; }"
-        )
+        btn_load.setObjectName("loadLicenseBtn")
         btn_load.clicked.connect(self._select_file)
         layout.addWidget(btn_load)
 
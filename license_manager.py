@@ -8,7 +8,7 @@ from cryptography.hazmat.primitives import serialization, hashes
 from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.exceptions import InvalidSignature
 
-from utils import get_app_dir
+from utils import get_app_dir, parse_json, write_bytes_atomic
 
 # Embed Public Key here (from generate_keys.py output)
 PUBLIC_KEY_PEM = b"""-----BEGIN PUBLIC KEY-----
@@ -23,12 +23,15 @@ uQIDAQAB
 
 LICENSE_FILE_NAME = "license.dat"
 
+# Parsed once per process instead of once per LicenseManager
+_PUBLIC_KEY = serialization.load_pem_public_key(PUBLIC_KEY_PEM)
+
 
 class LicenseManager:
     def __init__(self):
         self.app_dir = get_app_dir()
         self.license_path = self.app_dir / LICENSE_FILE_NAME
-        self.public_key = serialization.load_pem_public_key(PUBLIC_KEY_PEM)
+        self.public_key = _PUBLIC_KEY
         self.license_data: Optional[Dict] = None
         self.last_error = ""
 
@@ -41,13 +44,29 @@ class LicenseManager:
             return False
 
         try:
-            with open(self.license_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            content = self.license_path.read_bytes()
+        except OSError as e:
+            self.last_error = f"Validierung fehlgeschlagen: {e}"
+            return False
+
+        verify_data = self._verify_bytes(content)
+        if verify_data is None:
+            return False
+        self.license_data = verify_data
+        return True
+
+    def _verify_bytes(self, content: bytes) -> Optional[Dict]:
+        """
+        Parse license file content and check signature and expiry.
+        Returns the signed license data, or None (with last_error set).
+        """
+        try:
+            data = parse_json(content)
 
             signature_b64 = data.get("signature")
             if not signature_b64:
                 self.last_error = "Signatur fehlt in der Datei."
-                return False
+                return None
 
             signature = base64.b64decode(signature_b64)
 
@@ -55,7 +74,8 @@ class LicenseManager:
             verify_data = data.copy()
             del verify_data["signature"]
             
-            # Canonical JSON dump for verification
+            # Canonical JSON dump for verification. This stays on stdlib json:
+            # the signature covers these exact bytes, and orjson separators differ.
             payload = json.dumps(verify_data, sort_keys=True).encode("utf-8")
 
             # Verify
@@ -72,20 +92,18 @@ class LicenseManager:
                 expiry_date = datetime.strptime(expiry_str, "%Y-%m-%d").date()
                 if date.today() > expiry_date:
                     self.last_error = f"Lizenz ist abgelaufen am {expiry_str}"
-                    print(f"License expired on {expiry_str}")
-                    return False
+                    return None
             except ValueError:
                 self.last_error = "Ungültiges Datumsformat in Lizenz."
-                print("Invalid expiry date format")
-                return False
+                return None
 
-            self.license_data = verify_data
-            return True
+            return verify_data
 
-        except (json.JSONDecodeError, InvalidSignature, Exception) as e:
+        # ValueError covers malformed JSON and base64; AttributeError and
+        # TypeError cover well-formed JSON of the wrong shape
+        except (ValueError, TypeError, AttributeError, InvalidSignature) as e:
             self.last_error = f"Validierung fehlgeschlagen: {e}"
-            print(f"License verification failed: {e}")
-            return False
+            return None
 
     def get_info(self) -> str:
         if self.license_data:
@@ -95,20 +113,15 @@ class LicenseManager:
     def install_license(self, source_path: Path) -> bool:
         """Copy a license file to the app directory and verify it."""
         try:
-            # First verify the source file
-            temp_lm = LicenseManager()
-            temp_lm.license_path = source_path
-            if not temp_lm.load_license():
-                self.last_error = temp_lm.last_error
+            # Verify the source content once, then copy the same bytes
+            content = source_path.read_bytes()
+            verify_data = self._verify_bytes(content)
+            if verify_data is None:
                 return False
-            
-            # If valid, copy it
-            with open(source_path, "r", encoding="utf-8") as src:
-                content = src.read()
-            
-            with open(self.license_path, "w", encoding="utf-8") as dst:
-                dst.write(content)
-                
-            return self.load_license()
-        except Exception:
+
+            write_bytes_atomic(self.license_path, content)
+            self.license_data = verify_data
+            return True
+        except OSError as e:
+            self.last_error = f"Installation fehlgeschlagen: {e}"
             return False
@@ -5,30 +5,30 @@ Entry point for the PySide6 application.
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from PySide6.QtWidgets import QApplication
 from PySide6.QtGui import QFont
 
-from main_window import MainWindow
 from license_manager import LicenseManager
-from license_dialog import LicenseDialog
 from PySide6.QtWidgets import QDialog
 
 
 def get_resource_path(relative_path: str) -> Path:
     """Get the absolute path to a resource, works for dev and PyInstaller."""
-    if hasattr(sys, '_MEIPASS'):
+    if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
         # Running as PyInstaller bundle
         return Path(sys._MEIPASS) / relative_path
     return Path(__file__).parent / relative_path
 
 
+@lru_cache(maxsize=None)
 def load_stylesheet() -> str:
-    """Load the QSS stylesheet."""
+    """Load the QSS stylesheet (read once per process)."""
     qss_path = get_resource_path("style.qss")
     if qss_path.exists():
-        return qss_path.read_text(encoding="utf-8")
+        return qss_path.read_bytes().decode("utf-8")
     return ""
 
 
@@ -48,11 +48,14 @@ def main():
     # Check License
     lm = LicenseManager()
     if not lm.load_license():
+        from license_dialog import LicenseDialog
         dlg = LicenseDialog(lm)
         if dlg.exec() != QDialog.DialogCode.Accepted:
             sys.exit(0)
 
-    # Create and show main window
+    # Create and show main window. Imported here so the window and dialog
+    # modules load after QApplication exists and the license check passed.
+    from main_window import MainWindow
     window = MainWindow()
     window.show()
 
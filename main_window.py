@@ -5,8 +5,9 @@ summary cards, and a pie chart.
 """
 
 import csv
-import locale
+import io
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
 from PySide6.QtWidgets import (
@@ -17,8 +18,7 @@ from PySide6.QtWidgets import (
     QGridLayout,
     QLabel,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QFrame,
     QAbstractItemView,
@@ -27,14 +27,24 @@ from PySide6.QtWidgets import (
     QSpacerItem,
     QFileDialog,
 )
-from PySide6.QtCore import Qt, QSize, QMargins
+from PySide6.QtCore import (
+    Qt,
+    QSize,
+    QMargins,
+    QTimer,
+    QEvent,
+    QAbstractTableModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    Signal,
+)
 from PySide6.QtGui import QFont, QColor, QIcon, QPainter, QAction
-from PySide6.QtCharts import QChart, QChartView, QPieSeries, QPieSlice
 
 from data_manager import DataManager, MonthSheet, Transaction, RecurringManager, SavingsManager
 from transaction_dialog import TransactionDialog
-from about_dialog import AboutDialog
-from charts_dialog import ChartsDialog
 from pin_manager import require_pin, is_pin_set, PinSetupDialog, PinResetDialog
 from recurring_dialog import RecurringDialog
 from savings_dialog import SavingsDialog
@@ -52,6 +62,203 @@ PIE_COLORS = [
     "#073b4c", "#e76f51", "#2a9d8f", "#e9c46a", "#264653",
 ]
 
+# Display label, amount sign and colour per transaction type; anything
+# other than "income" is shown as an expense
+_TYPE_LABEL = {"income": "Einnahme", "expense": "Ausgabe"}
+_TYPE_SIGN = {"income": "+", "expense": "−"}
+
+# Transaction type as written to CSV exports
+CSV_TYPE_DE = _TYPE_LABEL
+# CSV rows are collected in memory and written to the file in chunks of this size
+_CSV_CHUNK_CHARS = 64 * 1024
+
+# Pending edits are written this long after the last change; a failed write
+# is retried after _SAVE_RETRY_MS
+_SAVE_DELAY_MS = 250
+_SAVE_RETRY_MS = 5000
+
+# Turns the "," thousands separator of format(..., ",") into German "."
+_DE_THOUSANDS = str.maketrans({",": "."})
+
+# Shared colour objects, built once instead of per cell or chart rebuild
+_COL_INCOME = QColor("#10b981")
+_COL_EXPENSE = QColor("#ef4444")
+_COL_DESCRIPTION = QColor("#8892b0")
+_COL_ROLLOVER_BG = QColor("#1e293b")
+_COL_CHART_BG = QColor("#16213e")
+_COL_CHART_TITLE = QColor("#8892b0")
+_COL_SLICE_BORDER = QColor("#1a1a2e")
+_COL_SLICE_LABEL = QColor("#e0e0e0")
+_PIE_QCOLORS = [QColor(c) for c in PIE_COLORS]
+_TYPE_COLOR = {"income": _COL_INCOME, "expense": _COL_EXPENSE}
+
+# Widget stylesheets
+_APP_NAME_QSS = (
+    "color: #4cc9f0; font-size: 14px; font-weight: 700; "
+    "letter-spacing: 1px; padding-right: 4px;"
+)
+
+
+@lru_cache(maxsize=None)
+def _font(point_size: int = -1, bold: bool = False, italic: bool = False) -> QFont:
+    """Return a shared QFont (created lazily, QApplication must exist)."""
+    font = QFont()
+    if point_size > 0:
+        font.setPointSize(point_size)
+    font.setBold(bold)
+    font.setItalic(italic)
+    return font
+
+
+# Both formatters are pure and called for every visible cell on repaint,
+# so results are memoized.
+@lru_cache(maxsize=2048)
+def _fmt_money(value: float) -> str:
+    """Format a monetary value: 1234.56 → '1.234,56 €'."""
+    # Manual German format on integer cents; avoids the float remainder
+    # that turned 0.999 into "0,100 €". The stdlib locale module is left
+    # out on purpose: setlocale() changes process-wide state.
+    cents = int(abs(value) * 100 + 0.5)
+    sign = "-" if value < 0 and cents else ""
+    euros, rest = divmod(cents, 100)
+    # Thousands separator
+    return f"{sign}{euros:,}".translate(_DE_THOUSANDS) + f",{rest:02d} €"
+
+
+@lru_cache(maxsize=2048)
+def _fmt_date(iso_date: str) -> str:
+    """Format ISO date to German: 2026-02-05 → 05.02.2026."""
+    parts = iso_date.split("-")
+    if len(parts) == 3:
+        return f"{parts[2]}.{parts[1]}.{parts[0]}"
+    return iso_date
+
+
+class _ExportSignals(QObject):
+    finished = Signal(int, int, str)  # transactions, months, path
+    failed = Signal(str)
+
+
+class ExportJob(QRunnable):
+    """Loads the given months and writes them to a CSV file in a worker thread."""
+
+    def __init__(self, path: str, months: list[tuple[int, int]], dm: DataManager):
+        super().__init__()
+        self.path = path
+        self.months = months
+        self.dm = dm
+        self.signals = _ExportSignals()
+
+    def run(self):
+        # Every outcome must emit finished or failed: the window re-enables
+        # the export action only in those slots
+        try:
+            # Private copies from disk; the cached sheets belong to the UI thread
+            sheets = [self.dm.read_month_copy(y, m) for y, m in self.months]
+            MainWindow._write_csv(self.path, sheets)
+            total = sum(len(s.transactions) for s in sheets)
+        except Exception as e:
+            self.signals.failed.emit(str(e) or type(e).__name__)
+            return
+        self.signals.finished.emit(total, len(sheets), self.path)
+
+
+class TransactionTableModel(QAbstractTableModel):
+    """
+    Serves a list of transactions to the main table.
+    Cells are formatted on demand in data(), so only visible rows cost work.
+    """
+
+    HEADERS = ("Datum", "Typ", "Kategorie", "Betrag", "Beschreibung")
+    # Raw values used for sorting; the display strings do not sort correctly
+    SORT_ROLE = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[Transaction] = []
+
+    def set_rows(self, rows: list[Transaction]):
+        self.beginResetModel()
+        # Own copy: the sheet list may change before the next reset
+        self._rows = list(rows)
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        tx = self._rows[index.row()]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return _fmt_date(tx.date)
+            if col == 1:
+                type_text = _TYPE_LABEL.get(tx.type, "Ausgabe")
+                if tx.recurring_id:
+                    type_text = "\u21bb " + type_text
+                return type_text
+            if col == 2:
+                return tx.category
+            if col == 3:
+                return f"{_TYPE_SIGN.get(tx.type, '−')} {_fmt_money(tx.amount)}"
+            if tx.is_rollover:
+                return tx.description + " (Automatisch)"
+            return tx.description
+
+        if role == Qt.ItemDataRole.UserRole:
+            return tx.id
+
+        if role == self.SORT_ROLE:
+            if col == 0:
+                return tx.date
+            if col == 1:
+                return tx.type
+            if col == 2:
+                return tx.category
+            if col == 3:
+                return tx.amount if tx.type == "income" else -tx.amount
+            return tx.description
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if col in (0, 1):
+                return Qt.AlignmentFlag.AlignCenter
+            if col == 3:
+                return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+            return None
+
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if col in (1, 3):
+                return _TYPE_COLOR.get(tx.type, _COL_EXPENSE)
+            if col == 4:
+                return _COL_DESCRIPTION
+            return None
+
+        if role == Qt.ItemDataRole.FontRole:
+            # Rollover rows are italic throughout
+            if tx.is_rollover:
+                return _font(italic=True)
+            if col in (1, 3):
+                return _font(bold=True)
+            return None
+
+        if role == Qt.ItemDataRole.BackgroundRole:
+            if tx.is_rollover:
+                return _COL_ROLLOVER_BG
+            return None
+
+        return None
+
 
 class MainWindow(QMainWindow):
     """Primary application window."""
@@ -66,6 +273,17 @@ class MainWindow(QMainWindow):
         self.rm = RecurringManager(self.dm.data_dir)
         self.sm = SavingsManager(self.dm.data_dir)
 
+        # Changes are written shortly after the last edit instead of per edit
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self._flush_data)
+        for manager in (self.dm, self.rm, self.sm):
+            manager.on_dirty = self._save_timer.start
+        # Last reported write error, so a retry that fails the same way
+        # does not show the same message again
+        self._save_error = None
+
         # Current month
         today = date.today()
         self.current_year = today.year
@@ -74,9 +292,74 @@ class MainWindow(QMainWindow):
         # Filter: "all", "income", "expense"
         self.current_filter = "all"
 
+        # Running all-months export, see _export_all_months
+        self._export_job = None
+
+        # Category totals the pie chart currently shows, see _update_chart_now
+        self._last_chart_cats = None
+        # A redraw was skipped while the chart was not visible; see eventFilter
+        self._chart_pending = False
+        # Coalesces chart redraws while the user flips through months
+        self._chart_timer = QTimer(self)
+        self._chart_timer.setSingleShot(True)
+        self._chart_timer.setInterval(120)
+        self._chart_timer.timeout.connect(self._update_chart_now)
+
         self._setup_ui()
         self._load_month()
 
+    def _write_pending(self) -> list[str]:
+        """
+        Flush every manager and return the error messages. Managers that
+        failed keep their changes and the save timer retries them.
+        """
+        self._save_timer.stop()
+        errors = []
+        for manager in (self.dm, self.rm, self.sm):
+            try:
+                manager.flush()
+            except OSError as e:
+                errors.append(str(e) or type(e).__name__)
+        if errors:
+            self._save_timer.start(_SAVE_RETRY_MS)
+        else:
+            self._save_timer.setInterval(_SAVE_DELAY_MS)
+            self._save_error = None
+        return errors
+
+    def _flush_data(self) -> bool:
+        """Write all pending changes to disk, reporting failures."""
+        errors = self._write_pending()
+        if not errors:
+            return True
+        message = "\n".join(errors)
+        if message != self._save_error:
+            self._save_error = message
+            QMessageBox.warning(
+                self, "Speichern fehlgeschlagen",
+                f"Änderungen konnten nicht gespeichert werden:\n{message}\n\n"
+                "Es wird in Kürze erneut versucht."
+            )
+        return False
+
+    def closeEvent(self, event):
+        errors = self._write_pending()
+        if errors:
+            reply = QMessageBox.question(
+                self,
+                "Speichern fehlgeschlagen",
+                "Änderungen konnten nicht gespeichert werden:\n"
+                + "\n".join(errors)
+                + "\n\nTrotzdem beenden? Nicht gespeicherte Änderungen gehen verloren.",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+                QMessageBox.StandardButton.No,
+            )
+            if reply != QMessageBox.StandardButton.Yes:
+                event.ignore()
+                return
+            self._save_timer.stop()
+        super().closeEvent(event)
+
     # ─── UI Setup ────────────────────────────────────────────────
 
     def _setup_ui(self):
@@ -100,7 +383,14 @@ class MainWindow(QMainWindow):
         sidebar = QVBoxLayout()
         sidebar.setSpacing(12)
         sidebar.addLayout(self._create_summary_cards())
-        sidebar.addWidget(self._create_chart_view())
+        # The chart is built on the first month with expenses, see
+        # _update_chart_now; until then this keeps its place in the layout
+        self._sidebar = sidebar
+        self.chart_view = None
+        self._chart_placeholder = QWidget()
+        self._chart_placeholder.setMinimumHeight(260)
+        self._chart_placeholder.installEventFilter(self)
+        sidebar.addWidget(self._chart_placeholder)
         sidebar.addStretch()
 
         sidebar_widget = QWidget()
@@ -132,10 +422,10 @@ class MainWindow(QMainWindow):
         export_month_action.triggered.connect(self._export_current_month)
         file_menu.addAction(export_month_action)
 
-        export_all_action = QAction("📚 Alle Monate exportieren (CSV)", self)
-        export_all_action.setStatusTip("Alle verfügbaren Monate als eine CSV exportieren")
-        export_all_action.triggered.connect(self._export_all_months)
-        file_menu.addAction(export_all_action)
+        self.export_all_action = QAction("📚 Alle Monate exportieren (CSV)", self)
+        self.export_all_action.setStatusTip("Alle verfügbaren Monate als eine CSV exportieren")
+        self.export_all_action.triggered.connect(self._export_all_months)
+        file_menu.addAction(self.export_all_action)
 
         file_menu.addSeparator()
 
@@ -178,10 +468,15 @@ class MainWindow(QMainWindow):
         help_menu.addAction(about_action)
 
     def _show_charts(self):
+        # Imported on demand: most sessions never open the statistics dialog
+        from charts_dialog import ChartsDialog
+        # The dialog reads recurring.json through its own RecurringManager
+        self._flush_data()
         dlg = ChartsDialog(self, data_manager=self.dm)
         dlg.exec()
 
     def _show_about(self):
+        from about_dialog import AboutDialog
         dlg = AboutDialog(self)
         dlg.exec()
 
@@ -247,30 +542,58 @@ class MainWindow(QMainWindow):
         if not path:
             return
 
-        sheets = [self.dm.load_month(y, m) for y, m in months]
-        total = sum(len(s.transactions) for s in sheets)
-        self._write_csv(path, sheets)
+        # Loading and writing every month runs in the background; the job is
+        # kept referenced until it reports back. Pending edits are written
+        # first because the worker reads the month files, not the caches.
+        errors = self._write_pending()
+        if errors:
+            self._on_export_failed("\n".join(errors))
+            return
+        self._export_job = ExportJob(path, months, self.dm)
+        self._export_job.signals.finished.connect(self._on_export_finished)
+        self._export_job.signals.failed.connect(self._on_export_failed)
+        self.export_all_action.setEnabled(False)
+        QThreadPool.globalInstance().start(self._export_job)
+
+    def _on_export_finished(self, total: int, month_count: int, path: str):
+        self._export_job = None
+        self.export_all_action.setEnabled(True)
         QMessageBox.information(
             self, "Export erfolgreich",
-            f"✅ {total} Transaktionen aus {len(sheets)} Monaten exportiert nach:\n{path}"
+            f"✅ {total} Transaktionen aus {month_count} Monaten exportiert nach:\n{path}"
         )
 
+    def _on_export_failed(self, message: str):
+        self._export_job = None
+        self.export_all_action.setEnabled(True)
+        QMessageBox.warning(self, "Export fehlgeschlagen", f"Fehler beim Export:\n{message}")
+
     @staticmethod
     def _write_csv(path: str, sheets: list):
         """Write transactions from one or more sheets to a CSV file."""
+        type_de = CSV_TYPE_DE
+        buf = io.StringIO()
+        writer = csv.writer(buf, delimiter=";", quoting=csv.QUOTE_MINIMAL)
+        writer.writerow(["Monat", "Datum", "Typ", "Kategorie", "Betrag", "Beschreibung"])
         with open(path, "w", newline="", encoding="utf-8-sig") as f:
-            writer = csv.writer(f, delimiter=";", quoting=csv.QUOTE_MINIMAL)
-            writer.writerow(["Monat", "Datum", "Typ", "Kategorie", "Betrag", "Beschreibung"])
             for sheet in sheets:
-                for tx in sheet.transactions:
-                    writer.writerow([
-                        sheet.month_key,
+                month_key = sheet.month_key
+                writer.writerows(
+                    (
+                        month_key,
                         tx.date,
-                        "Einnahme" if tx.type == "income" else "Ausgabe",
+                        type_de.get(tx.type, "Ausgabe"),
                         tx.category,
                         f"{tx.amount:.2f}".replace(".", ","),
                         tx.description,
-                    ])
+                    )
+                    for tx in sheet.transactions
+                )
+                if buf.tell() >= _CSV_CHUNK_CHARS:
+                    f.write(buf.getvalue())
+                    buf.seek(0)
+                    buf.truncate()
+            f.write(buf.getvalue())
 
     # ── Nav Bar ──
 
@@ -299,10 +622,7 @@ class MainWindow(QMainWindow):
 
         # App branding – right corner
         app_name_label = QLabel("💰 CashMonitor")
-        app_name_label.setStyleSheet(
-            "color: #4cc9f0; font-size: 14px; font-weight: 700; "
-            "letter-spacing: 1px; padding-right: 4px;"
-        )
+        app_name_label.setStyleSheet(_APP_NAME_QSS)
         app_name_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
         nav.addWidget(app_name_label)
 
@@ -351,11 +671,6 @@ class MainWindow(QMainWindow):
         self.prognose_label.setObjectName("prognoseLabel")
         self.prognose_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.prognose_label.setWordWrap(True)
-        self.prognose_label.setStyleSheet(
-            "color: #fbbf24; font-size: 12px; padding: 8px 12px; "
-            "background-color: rgba(251, 191, 36, 0.08); "
-            "border: 1px dashed #fbbf24; border-radius: 8px;"
-        )
         self.prognose_label.setVisible(False)
         grid.addWidget(self.prognose_label, 2, 0, 1, 2)
 
@@ -368,29 +683,31 @@ class MainWindow(QMainWindow):
 
     # ── Pie Chart ──
 
-    def _create_chart_view(self) -> QChartView:
+    def _create_chart_view(self) -> QWidget:
+        from PySide6.QtCharts import QChart, QChartView, QPieSeries
+
         self.chart = QChart()
         self.chart.setTitle("Ausgaben nach Kategorie")
-        self.chart.setAnimationOptions(QChart.AnimationOption.SeriesAnimations)
-        self.chart.setBackgroundBrush(QColor("#16213e"))
-        self.chart.setTitleBrush(QColor("#8892b0"))
-        title_font = QFont()
-        title_font.setPointSize(11)
-        title_font.setBold(True)
-        self.chart.setTitleFont(title_font)
-        self.chart.legend().setLabelColor(QColor("#8892b0"))
+        self.chart.setAnimationOptions(QChart.AnimationOption.NoAnimation)
+        self.chart.setBackgroundBrush(_COL_CHART_BG)
+        self.chart.setTitleBrush(_COL_CHART_TITLE)
+        self.chart.setTitleFont(_font(11, bold=True))
+        self.chart.legend().setLabelColor(_COL_CHART_TITLE)
         self.chart.legend().setAlignment(Qt.AlignmentFlag.AlignBottom)
-        legend_font = QFont()
-        legend_font.setPointSize(9)
-        self.chart.legend().setFont(legend_font)
+        self.chart.legend().setFont(_font(9))
         self.chart.setMargins(QMargins(4, 4, 4, 4))
 
+        # One series for the window's lifetime; _update_chart_now refills it
+        self.pie_series = QPieSeries()
+        self.pie_series.setHoleSize(0.35)
+        self.chart.addSeries(self.pie_series)
+        self._pie_categories: list[str] = []
+
         self.chart_view = QChartView(self.chart)
         self.chart_view.setRenderHint(QPainter.RenderHint.Antialiasing)
         self.chart_view.setMinimumHeight(260)
-        self.chart_view.setStyleSheet(
-            "background: #16213e; border: 1px solid #0f3460; border-radius: 12px;"
-        )
+        self.chart_view.setObjectName("chartView")
+        self.chart_view.installEventFilter(self)
 
         return self.chart_view
 
@@ -456,12 +773,14 @@ class MainWindow(QMainWindow):
 
     # ── Table ──
 
-    def _create_table(self) -> QTableWidget:
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(
-            ["Datum", "Typ", "Kategorie", "Betrag", "Beschreibung"]
-        )
+    def _create_table(self) -> QTableView:
+        self.table_model = TransactionTableModel(self)
+        self.table_proxy = QSortFilterProxyModel(self)
+        self.table_proxy.setSourceModel(self.table_model)
+        self.table_proxy.setSortRole(TransactionTableModel.SORT_ROLE)
+
+        self.table = QTableView()
+        self.table.setModel(self.table_proxy)
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
@@ -515,13 +834,14 @@ class MainWindow(QMainWindow):
             self.month_label.setText(f"{name} {self.current_year}")
 
     def _update_summary(self):
-        income = self.sheet.total_income
-        expense = self.sheet.total_expense
-        balance = self.sheet.balance
+        summary = self.sheet.summary()
+        income = summary.total_income
+        expense = summary.total_expense
+        balance = summary.balance
 
-        self.income_value.setText(self._fmt_money(income))
-        self.expense_value.setText(self._fmt_money(expense))
-        self.balance_value.setText(self._fmt_money(balance))
+        self.income_value.setText(_fmt_money(income))
+        self.expense_value.setText(_fmt_money(expense))
+        self.balance_value.setText(_fmt_money(balance))
 
         # Color-code balance
         if balance >= 0:
@@ -539,9 +859,9 @@ class MainWindow(QMainWindow):
             sign = "+" if prog_balance >= 0 else ""
             self.prognose_label.setText(
                 f"Prognose (Fixeintraege):  "
-                f"Einnahmen {self._fmt_money(prog_income)}  |  "
-                f"Ausgaben {self._fmt_money(prog_expense)}  |  "
-                f"Bilanz {sign}{self._fmt_money(prog_balance)}"
+                f"Einnahmen {_fmt_money(prog_income)}  |  "
+                f"Ausgaben {_fmt_money(prog_expense)}  |  "
+                f"Bilanz {sign}{_fmt_money(prog_balance)}"
             )
             self.prognose_label.setVisible(True)
         elif self._is_current_month():
@@ -560,9 +880,9 @@ class MainWindow(QMainWindow):
                 sign = "+" if p_balance >= 0 else ""
                 self.prognose_label.setText(
                     f"Ausstehend (Fixeintraege):  "
-                    f"Einnahmen {self._fmt_money(p_income)}  |  "
-                    f"Ausgaben {self._fmt_money(p_expense)}  |  "
-                    f"Bilanz {sign}{self._fmt_money(p_balance)}"
+                    f"Einnahmen {_fmt_money(p_income)}  |  "
+                    f"Ausgaben {_fmt_money(p_expense)}  |  "
+                    f"Bilanz {sign}{_fmt_money(p_balance)}"
                 )
                 self.prognose_label.setVisible(True)
             else:
@@ -572,47 +892,83 @@ class MainWindow(QMainWindow):
 
     def _get_prognose(self) -> tuple[float, float]:
         """Calculate projected income and expenses from active recurring items."""
-        prog_income = sum(r.amount for r in self.rm.items if r.active and r.type == "income")
-        prog_expense = sum(r.amount for r in self.rm.items if r.active and r.type == "expense")
+        prog_income = prog_expense = 0.0
+        for r in self.rm.items:
+            if not r.active:
+                continue
+            if r.type == "income":
+                prog_income += r.amount
+            elif r.type == "expense":
+                prog_expense += r.amount
         return round(prog_income, 2), round(prog_expense, 2)
 
     def _update_chart(self):
-        self.chart.removeAllSeries()
-
+        """Schedule a pie chart redraw for the current sheet."""
+        self._chart_timer.start()
+
+    def eventFilter(self, obj, event):
+        # Catch up on a redraw skipped while the chart area was not visible
+        if (
+            event.type() == QEvent.Type.Show
+            and self._chart_pending
+            and obj in (self.chart_view, self._chart_placeholder)
+        ):
+            self._chart_timer.start()
+        return super().eventFilter(obj, event)
+
+    def _update_chart_now(self):
+        view = self.chart_view if self.chart_view is not None else self._chart_placeholder
+        if not view.isVisible():
+            self._chart_pending = True
+            return
+        self._chart_pending = False
         cats = self.sheet.expense_by_category()
+        if self.chart_view is None:
+            if not cats:
+                return
+            self._sidebar.replaceWidget(self._chart_placeholder, self._create_chart_view())
+            self._chart_placeholder.deleteLater()
+            self._chart_placeholder = None
+        # Same slices as already shown (e.g. after an income-only edit)
+        if cats == self._last_chart_cats:
+            return
+        self._last_chart_cats = cats
+
+        series = self.pie_series
         if not cats:
+            series.clear()
+            self._pie_categories = []
             self.chart.setTitle("Keine Ausgaben")
             return
 
         self.chart.setTitle("Ausgaben nach Kategorie")
-        series = QPieSeries()
-        series.setHoleSize(0.35)
-
         sorted_cats = sorted(cats.items(), key=lambda x: x[1], reverse=True)
+        categories = [cat for cat, _ in sorted_cats]
+
+        if categories == self._pie_categories:
+            # Same slices in the same order: only values and labels change
+            for sl, (cat, amount) in zip(series.slices(), sorted_cats):
+                sl.setValue(amount)
+                sl.setLabel(f"{cat}: {_fmt_money(amount)}")
+            return
+
+        series.clear()
+        self._pie_categories = categories
         for i, (cat, amount) in enumerate(sorted_cats):
-            sl = series.append(f"{cat}: {self._fmt_money(amount)}", amount)
-            sl.setBrush(QColor(PIE_COLORS[i % len(PIE_COLORS)]))
-            sl.setBorderColor(QColor("#1a1a2e"))
+            sl = series.append(f"{cat}: {_fmt_money(amount)}", amount)
+            sl.setBrush(_PIE_QCOLORS[i % len(_PIE_QCOLORS)])
+            sl.setBorderColor(_COL_SLICE_BORDER)
             sl.setBorderWidth(2)
 
         # Explode the largest slice
-        if series.count() > 0:
-            biggest = series.slices()[0]
-            biggest.setExploded(True)
-            biggest.setExplodeDistanceFactor(0.06)
-            biggest.setLabelVisible(True)
-            biggest.setLabelColor(QColor("#e0e0e0"))
-            label_font = QFont()
-            label_font.setPointSize(10)
-            label_font.setBold(True)
-            biggest.setLabelFont(label_font)
-
-        self.chart.addSeries(series)
+        biggest = series.slices()[0]
+        biggest.setExploded(True)
+        biggest.setExplodeDistanceFactor(0.06)
+        biggest.setLabelVisible(True)
+        biggest.setLabelColor(_COL_SLICE_LABEL)
+        biggest.setLabelFont(_font(10, bold=True))
 
     def _update_table(self):
-        self.table.setSortingEnabled(False)
-        self.table.setRowCount(0)
-
         # Apply filter
         if self.current_filter == "income":
             txns = self.sheet.incomes
@@ -621,62 +977,7 @@ class MainWindow(QMainWindow):
         else:
             txns = self.sheet.transactions
 
-        self.table.setRowCount(len(txns))
-
-        for row, tx in enumerate(txns):
-            # Date
-            date_item = QTableWidgetItem(self._fmt_date(tx.date))
-            date_item.setData(Qt.ItemDataRole.UserRole, tx.id)
-            date_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 0, date_item)
-
-            # Type
-            type_text = "Einnahme" if tx.type == "income" else "Ausgabe"
-            if tx.recurring_id:
-                type_text = "\u21bb " + type_text
-            type_item = QTableWidgetItem(type_text)
-            type_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            type_color = QColor("#10b981") if tx.type == "income" else QColor("#ef4444")
-            type_item.setForeground(type_color)
-            font = QFont()
-            font.setBold(True)
-            type_item.setFont(font)
-            self.table.setItem(row, 1, type_item)
-
-            # Category
-            cat_item = QTableWidgetItem(tx.category)
-            self.table.setItem(row, 2, cat_item)
-
-            # Amount
-            prefix = "+" if tx.type == "income" else "−"
-            amount_item = QTableWidgetItem(f"{prefix} {self._fmt_money(tx.amount)}")
-            amount_item.setTextAlignment(
-                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-            )
-            amount_color = QColor("#10b981") if tx.type == "income" else QColor("#ef4444")
-            amount_item.setForeground(amount_color)
-            bold_font = QFont()
-            bold_font.setBold(True)
-            amount_item.setFont(bold_font)
-            self.table.setItem(row, 3, amount_item)
-
-            # Description
-            desc_item = QTableWidgetItem(tx.description)
-            desc_item.setForeground(QColor("#8892b0"))
-            self.table.setItem(row, 4, desc_item)
-
-            # Special styling for rollover
-            if getattr(tx, "is_rollover", False):
-                font = QFont()
-                font.setItalic(True)
-                for col in range(5):
-                    item = self.table.item(row, col)
-                    item.setFont(font)
-                    item.setBackground(QColor("#1e293b"))
-                    if col == 4: # Desc
-                        item.setText(item.text() + " (Automatisch)")
-
-        self.table.setSortingEnabled(True)
+        self.table_model.set_rows(txns)
 
     # ─── Actions ─────────────────────────────────────────────────
 
@@ -720,13 +1021,10 @@ class MainWindow(QMainWindow):
             return
 
         # Find the transaction
-        tx = None
-        for t in self.sheet.transactions:
-            if t.id == tx_id:
-                tx = t
-                break
-        if tx is None:
+        i = self.sheet.index_of(tx_id)
+        if i < 0:
             return
+        tx = self.sheet.transactions[i]
 
         dlg = TransactionDialog(self, transaction=tx)
         if dlg.exec() == TransactionDialog.DialogCode.Accepted:
@@ -761,35 +1059,12 @@ class MainWindow(QMainWindow):
         rows = self.table.selectionModel().selectedRows()
         if not rows:
             return None
-        row = rows[0].row()
-        item = self.table.item(row, 0)
-        if item is None:
-            return None
-        return item.data(Qt.ItemDataRole.UserRole)
+        return rows[0].data(Qt.ItemDataRole.UserRole)
 
     def _refresh_after_change(self):
-        """Reload data and refresh all UI elements."""
-        self.sheet = self.dm.load_month(self.current_year, self.current_month)
+        """Refresh all UI elements after self.sheet was changed in place."""
+        # DataManager mutates and invalidates the sheet itself, so there is
+        # nothing to reload.
         self._update_summary()
         self._update_chart()
         self._update_table()
-
-    @staticmethod
-    def _fmt_money(value: float) -> str:
-        """Format a monetary value: 1234.56 → '1.234,56 €'."""
-        # Manual German format
-        sign = "-" if value < 0 else ""
-        value = abs(value)
-        integer_part = int(value)
-        decimal_part = round((value - integer_part) * 100)
-        # Thousands separator
-        int_str = f"{integer_part:,}".replace(",", ".")
-        return f"{sign}{int_str},{decimal_part:02d} €"
-
-    @staticmethod
-    def _fmt_date(iso_date: str) -> str:
-        """Format ISO date to German: 2026-02-05 → 05.02.2026."""
-        parts = iso_date.split("-")
-        if len(parts) == 3:
-            return f"{parts[2]}.{parts[1]}.{parts[0]}"
-        return iso_date
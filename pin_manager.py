@@ -1,11 +1,13 @@
 """
 CashMonitor – PIN Manager
 Handles PIN setup, verification, and reset for edit/delete protection.
-The PIN is stored as a SHA-256 hash in a config file.
+The PIN is stored as a salted PBKDF2-HMAC-SHA256 hash in a config file;
+plain SHA-256 hashes from older versions are upgraded on the next successful check.
 """
 
 import hashlib
-import json
+import hmac
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -23,26 +25,42 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QFont
 
 
-from utils import get_app_dir
+from utils import get_app_dir, read_json, write_json
 
 CONFIG_FILE = get_app_dir() / "config.json"
 RESET_CODE = "CASHMONITOR-RESET-2026"
+# PBKDF2 work factor for newly set PINs; stored per config as "pin_iter"
+_PIN_ITERATIONS = 200_000
 
+# Parsed config.json; read once per process and replaced on every save
+_config_cache: Optional[dict] = None
 
-def _hash_pin(pin: str) -> str:
-    return hashlib.sha256(pin.encode("utf-8")).hexdigest()
+# Widget stylesheets
+_PIN_EDIT_QSS = "font-size: 18px; letter-spacing: 8px; padding: 8px;"
+_PIN_VERIFY_QSS = "font-size: 20px; letter-spacing: 10px; padding: 8px;"
+_OLD_PIN_QSS = "font-size: 14px; padding: 8px; border: 1px solid #f59e0b;"
+
+
+def _pin_digest(pin: str, salt: Optional[bytes], iterations: int = _PIN_ITERATIONS) -> bytes:
+    """Derive the PIN digest; without a salt this is the legacy plain SHA-256."""
+    data = pin.encode("utf-8")
+    if salt is None:
+        return hashlib.sha256(data).digest()
+    return hashlib.pbkdf2_hmac("sha256", data, salt, iterations)
 
 
 def _load_config() -> dict:
-    if CONFIG_FILE.exists():
-        with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    return {}
+    """Return the cached config; callers must not modify it in place."""
+    global _config_cache
+    if _config_cache is None:
+        _config_cache = read_json(CONFIG_FILE) if CONFIG_FILE.exists() else {}
+    return _config_cache
 
 
 def _save_config(config: dict):
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(config, f, ensure_ascii=False, indent=2)
+    global _config_cache
+    write_json(CONFIG_FILE, config)
+    _config_cache = config
 
 
 def is_pin_set() -> bool:
@@ -55,26 +73,58 @@ def verify_pin(pin: str) -> bool:
     """Verify a PIN against the stored hash."""
     config = _load_config()
     stored = config.get("pin_hash", "")
-    return _hash_pin(pin) == stored
+    if not stored:
+        return False
+    try:
+        stored_digest = bytes.fromhex(stored)
+        salt = bytes.fromhex(config["pin_salt"]) if "pin_salt" in config else None
+        iterations = int(config.get("pin_iter", _PIN_ITERATIONS))
+    except (ValueError, TypeError):
+        return False
+    # Constant-time: the comparison must not reveal how many bytes matched
+    ok = hmac.compare_digest(_pin_digest(pin, salt, iterations), stored_digest)
+    if ok and salt is None:
+        # Replace the unsalted legacy hash now that the PIN is known
+        try:
+            set_pin(pin)
+        except OSError:
+            pass
+    return ok
 
 
 def set_pin(pin: str):
     """Set or overwrite the PIN."""
-    config = _load_config()
-    config["pin_hash"] = _hash_pin(pin)
+    config = dict(_load_config())
+    salt = os.urandom(16)
+    config["pin_salt"] = salt.hex()
+    config["pin_iter"] = _PIN_ITERATIONS
+    config["pin_hash"] = _pin_digest(pin, salt).hex()
     _save_config(config)
 
 
 def reset_pin():
     """Remove the stored PIN."""
-    config = _load_config()
+    config = dict(_load_config())
     config.pop("pin_hash", None)
+    config.pop("pin_salt", None)
+    config.pop("pin_iter", None)
     _save_config(config)
 
 
 # ─── Dialogs ─────────────────────────────────────────────────
 
 
+def _pin_edit(placeholder: str, style: str = _PIN_EDIT_QSS) -> QLineEdit:
+    """Create a masked, centred input for a 4-6 digit PIN."""
+    edit = QLineEdit()
+    edit.setPlaceholderText(placeholder)
+    edit.setEchoMode(QLineEdit.EchoMode.Password)
+    edit.setMaxLength(6)
+    edit.setAlignment(Qt.AlignmentFlag.AlignCenter)
+    edit.setStyleSheet(style)
+    return edit
+
+
 class PinSetupDialog(QDialog):
     """Dialog to set up a new PIN (first time or after reset)."""
 
@@ -113,30 +163,15 @@ class PinSetupDialog(QDialog):
 
         # Old PIN (if exists)
         if self.require_old:
-            self.old_pin_edit = QLineEdit()
-            self.old_pin_edit.setPlaceholderText("Alte PIN eingeben")
-            self.old_pin_edit.setEchoMode(QLineEdit.EchoMode.Password)
-            self.old_pin_edit.setMaxLength(6)
-            self.old_pin_edit.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.old_pin_edit.setStyleSheet("font-size: 14px; padding: 8px; border: 1px solid #f59e0b;")
+            self.old_pin_edit = _pin_edit("Alte PIN eingeben", _OLD_PIN_QSS)
             layout.addWidget(self.old_pin_edit)
 
         # PIN input
-        self.pin_edit = QLineEdit()
-        self.pin_edit.setPlaceholderText("PIN eingeben (4-6 Ziffern)")
-        self.pin_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        self.pin_edit.setMaxLength(6)
-        self.pin_edit.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.pin_edit.setStyleSheet("font-size: 18px; letter-spacing: 8px; padding: 8px;")
+        self.pin_edit = _pin_edit("PIN eingeben (4-6 Ziffern)")
         layout.addWidget(self.pin_edit)
 
         # Confirm input
-        self.confirm_edit = QLineEdit()
-        self.confirm_edit.setPlaceholderText("PIN bestätigen")
-        self.confirm_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        self.confirm_edit.setMaxLength(6)
-        self.confirm_edit.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.confirm_edit.setStyleSheet("font-size: 18px; letter-spacing: 8px; padding: 8px;")
+        self.confirm_edit = _pin_edit("PIN bestätigen")
         layout.addWidget(self.confirm_edit)
 
         self.error_label = QLabel("")
@@ -153,11 +188,7 @@ class PinSetupDialog(QDialog):
         btn_layout.addWidget(skip_btn)
 
         save_btn = QPushButton("💾 PIN setzen")
-        save_btn.setStyleSheet(
-            "QPushButton { background-color: #064e3b; border-color: #10b981; "
-            "color: #6ee7b7; font-weight: bold; padding: 8px 24px; border-radius: 8px; }"
-            "QPushButton:hover { background-color: #065f46; }"
-        )
+        save_btn.setObjectName("saveBtn")
         save_btn.clicked.connect(self._on_save)
         btn_layout.addWidget(save_btn)
 
@@ -215,12 +246,7 @@ class PinVerifyDialog(QDialog):
         info.setAlignment(Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(info)
 
-        self.pin_edit = QLineEdit()
-        self.pin_edit.setPlaceholderText("PIN")
-        self.pin_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        self.pin_edit.setMaxLength(6)
-        self.pin_edit.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.pin_edit.setStyleSheet("font-size: 20px; letter-spacing: 10px; padding: 8px;")
+        self.pin_edit = _pin_edit("PIN", _PIN_VERIFY_QSS)
         self.pin_edit.returnPressed.connect(self._on_check)
         layout.addWidget(self.pin_edit)
 
@@ -238,11 +264,7 @@ class PinVerifyDialog(QDialog):
         btn_layout.addWidget(cancel_btn)
 
         ok_btn = QPushButton("🔓 Bestätigen")
-        ok_btn.setStyleSheet(
-            "QPushButton { background-color: #0f3460; border-color: #4cc9f0; "
-            "color: #4cc9f0; font-weight: bold; padding: 8px 24px; border-radius: 8px; }"
-            "QPushButton:hover { background-color: #16213e; }"
-        )
+        ok_btn.setObjectName("confirmPinBtn")
         ok_btn.clicked.connect(self._on_check)
         btn_layout.addWidget(ok_btn)
 
@@ -310,11 +332,7 @@ class PinResetDialog(QDialog):
         btn_layout.addWidget(cancel_btn)
 
         reset_btn = QPushButton("🔑 Zurücksetzen")
-        reset_btn.setStyleSheet(
-            "QPushButton { background-color: #7f1d1d; border-color: #ef4444; "
-            "color: #fca5a5; font-weight: bold; padding: 8px 24px; border-radius: 8px; }"
-            "QPushButton:hover { background-color: #991b1b; }"
-        )
+        reset_btn.setObjectName("resetPinBtn")
         reset_btn.clicked.connect(self._on_reset)
         btn_layout.addWidget(reset_btn)
 
@@ -322,7 +340,8 @@ class PinResetDialog(QDialog):
 
     def _on_reset(self):
         code = self.code_edit.text().strip()
-        if code == RESET_CODE:
+        # Bytes, as compare_digest rejects non-ASCII str input
+        if hmac.compare_digest(code.encode("utf-8"), RESET_CODE.encode("utf-8")):
             reset_pin()
             QMessageBox.information(
                 self,
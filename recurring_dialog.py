@@ -3,6 +3,8 @@ CashMonitor – Recurring Transactions Dialog
 Manage recurring (fixed) monthly income and expense entries.
 """
 
+from functools import lru_cache
+
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -30,6 +32,41 @@ from data_manager import (
     INCOME_CATEGORIES,
 )
 
+# Shared colour objects and alignments, built once instead of per table cell
+_COL_ACTIVE = QColor("#10b981")
+_COL_PAUSED = QColor("#6b7280")
+_COL_INCOME = QColor("#10b981")
+_COL_EXPENSE = QColor("#ef4444")
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_ALIGN_RIGHT = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+# Swaps the separators of format(..., ",.2f") into German: 1,234.56 → 1.234,56
+_DE_NUMBER = str.maketrans({",": ".", ".": ","})
+
+# Widget stylesheets
+_TITLE_QSS = "color: #4cc9f0;"
+_SEP_QSS = "color: #0f3460;"
+_INFO_QSS = "color: #8892b0; font-size: 11px;"
+
+
+@lru_cache(maxsize=None)
+def _title_font(point_size: int) -> QFont:
+    """Return the bold dialog title font (built after QApplication)."""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(True)
+    return font
+
+
+def _mkitem(text: str, align=None, fg: QColor = None) -> QTableWidgetItem:
+    """Create a table cell, setting alignment and colour only when given."""
+    cell = QTableWidgetItem(text)
+    if align is not None:
+        cell.setTextAlignment(align)
+    if fg is not None:
+        cell.setForeground(fg)
+    return cell
+
 
 class RecurringItemDialog(QDialog):
     """Dialog to add or edit a single recurring item."""
@@ -40,6 +77,8 @@ class RecurringItemDialog(QDialog):
         self.setFixedSize(400, 320)
         self.setModal(True)
         self._item = item
+        # Category list the combo currently holds, see _update_categories
+        self._category_list = None
         self._setup_ui()
         if item:
             self._populate(item)
@@ -51,16 +90,13 @@ class RecurringItemDialog(QDialog):
 
         title_text = "Dauerauftrag bearbeiten" if self._item else "Neuer Dauerauftrag"
         title = QLabel(title_text)
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title.setFont(title_font)
-        title.setStyleSheet("color: #4cc9f0;")
+        title.setFont(_title_font(14))
+        title.setStyleSheet(_TITLE_QSS)
         layout.addWidget(title)
 
         sep = QFrame()
         sep.setFrameShape(QFrame.Shape.HLine)
-        sep.setStyleSheet("color: #0f3460;")
+        sep.setStyleSheet(_SEP_QSS)
         layout.addWidget(sep)
 
         form = QFormLayout()
@@ -108,11 +144,7 @@ class RecurringItemDialog(QDialog):
         btn_layout.addWidget(cancel_btn)
 
         save_btn = QPushButton("Speichern")
-        save_btn.setStyleSheet(
-            "QPushButton { background-color: #064e3b; border-color: #10b981; "
-            "color: #6ee7b7; font-weight: bold; padding: 8px 24px; border-radius: 8px; }"
-            "QPushButton:hover { background-color: #065f46; }"
-        )
+        save_btn.setObjectName("saveBtn")
         save_btn.clicked.connect(self._on_save)
         btn_layout.addWidget(save_btn)
 
@@ -122,12 +154,13 @@ class RecurringItemDialog(QDialog):
         self._update_categories()
 
     def _update_categories(self):
+        target = INCOME_CATEGORIES if self.type_combo.currentIndex() == 0 else EXPENSE_CATEGORIES
+        if target is self._category_list:
+            return
+        self._category_list = target
         current = self.category_combo.currentText()
         self.category_combo.clear()
-        if self.type_combo.currentIndex() == 0:
-            self.category_combo.addItems(INCOME_CATEGORIES)
-        else:
-            self.category_combo.addItems(EXPENSE_CATEGORIES)
+        self.category_combo.addItems(target)
         idx = self.category_combo.findText(current)
         if idx >= 0:
             self.category_combo.setCurrentIndex(idx)
@@ -186,22 +219,19 @@ class RecurringDialog(QDialog):
         # Header
         header_layout = QHBoxLayout()
         title = QLabel("Wiederkehrende Eintraege")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title.setFont(title_font)
-        title.setStyleSheet("color: #4cc9f0;")
+        title.setFont(_title_font(16))
+        title.setStyleSheet(_TITLE_QSS)
         header_layout.addWidget(title)
         header_layout.addStretch()
 
         info = QLabel("Fixkosten und Fixeinnahmen, die jeden Monat automatisch eingetragen werden.")
-        info.setStyleSheet("color: #8892b0; font-size: 11px;")
+        info.setStyleSheet(_INFO_QSS)
         header_layout.addWidget(info)
         layout.addLayout(header_layout)
 
         sep = QFrame()
         sep.setFrameShape(QFrame.Shape.HLine)
-        sep.setStyleSheet("color: #0f3460;")
+        sep.setStyleSheet(_SEP_QSS)
         layout.addWidget(sep)
 
         # Table
@@ -226,11 +256,7 @@ class RecurringDialog(QDialog):
         btn_layout = QHBoxLayout()
 
         add_btn = QPushButton("+ Hinzufuegen")
-        add_btn.setStyleSheet(
-            "QPushButton { background-color: #064e3b; border-color: #10b981; "
-            "color: #6ee7b7; font-weight: bold; padding: 8px 16px; border-radius: 8px; }"
-            "QPushButton:hover { background-color: #065f46; }"
-        )
+        add_btn.setObjectName("addItemBtn")
         add_btn.clicked.connect(self._add_item)
         btn_layout.addWidget(add_btn)
 
@@ -245,55 +271,53 @@ class RecurringDialog(QDialog):
         btn_layout.addStretch()
 
         delete_btn = QPushButton("Loeschen")
-        delete_btn.setStyleSheet(
-            "QPushButton { background-color: #7f1d1d; border-color: #ef4444; "
-            "color: #fca5a5; padding: 8px 16px; border-radius: 8px; }"
-            "QPushButton:hover { background-color: #991b1b; }"
-        )
+        delete_btn.setObjectName("removeItemBtn")
         delete_btn.clicked.connect(self._delete_item)
         btn_layout.addWidget(delete_btn)
 
         layout.addLayout(btn_layout)
 
     def _load_table(self):
+        # Fill with repaints off and all rows allocated up front
+        self.table.setUpdatesEnabled(False)
         self.table.setRowCount(0)
-        for item in self.rm.items:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            # Status
-            status = QTableWidgetItem("Aktiv" if item.active else "Pausiert")
-            status.setForeground(QColor("#10b981") if item.active else QColor("#6b7280"))
-            status.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            status.setData(Qt.ItemDataRole.UserRole, item.id)
-            self.table.setItem(row, 0, status)
-
-            # Day
-            day_item = QTableWidgetItem(f"{item.day:02d}.")
-            day_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 1, day_item)
-
-            # Type
-            type_text = "Einnahme" if item.type == "income" else "Ausgabe"
-            type_item = QTableWidgetItem(type_text)
-            type_item.setForeground(
-                QColor("#10b981") if item.type == "income" else QColor("#ef4444")
-            )
-            type_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 2, type_item)
-
-            # Category
-            self.table.setItem(row, 3, QTableWidgetItem(item.category))
-
-            # Amount
-            amount_item = QTableWidgetItem(f"{item.amount:,.2f} EUR".replace(",", "."))
-            amount_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            self.table.setItem(row, 4, amount_item)
-
-            # Description
-            self.table.setItem(row, 5, QTableWidgetItem(item.description))
+        self.table.setRowCount(len(self.rm.items))
+        for row, item in enumerate(self.rm.items):
+            self._set_row(row, item)
+        self.table.setUpdatesEnabled(True)
+
+    def _set_status(self, row: int, item: RecurringItem):
+        status = _mkitem(
+            "Aktiv" if item.active else "Pausiert",
+            _ALIGN_CENTER,
+            _COL_ACTIVE if item.active else _COL_PAUSED,
+        )
+        status.setData(Qt.ItemDataRole.UserRole, item.id)
+        self.table.setItem(row, 0, status)
+
+    def _set_row(self, row: int, item: RecurringItem):
+        """Fill all cells of one table row from a recurring item."""
+        table = self.table
+        is_income = item.type == "income"
+        self._set_status(row, item)
+        table.setItem(row, 1, _mkitem(f"{item.day:02d}.", _ALIGN_CENTER))
+        table.setItem(row, 2, _mkitem(
+            "Einnahme" if is_income else "Ausgabe",
+            _ALIGN_CENTER,
+            _COL_INCOME if is_income else _COL_EXPENSE,
+        ))
+        table.setItem(row, 3, _mkitem(item.category))
+        table.setItem(row, 4, _mkitem(f"{item.amount:,.2f}".translate(_DE_NUMBER) + " EUR", _ALIGN_RIGHT))
+        table.setItem(row, 5, _mkitem(item.description))
+
+    def _append_row(self, item: RecurringItem):
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        self._set_row(row, item)
 
     def _selected_id(self):
+        # Table rows mirror rm.items, so the selected row also locates the
+        # cells to refresh; the item itself comes from the manager's id index
         row = self.table.currentRow()
         if row < 0:
             QMessageBox.information(self, "Hinweis", "Bitte einen Eintrag auswaehlen.")
@@ -305,33 +329,29 @@ class RecurringDialog(QDialog):
         if dlg.exec() == QDialog.DialogCode.Accepted:
             item = dlg.get_item()
             self.rm.add(item)
-            self._load_table()
+            self._append_row(item)
 
     def _edit_item(self):
         item_id = self._selected_id()
         if item_id is None:
             return
 
-        item = None
-        for it in self.rm.items:
-            if it.id == item_id:
-                item = it
-                break
+        item = self.rm.get(item_id)
         if item is None:
             return
 
         dlg = RecurringItemDialog(self, item=item)
         if dlg.exec() == QDialog.DialogCode.Accepted:
             updated = dlg.get_item()
-            self.rm.update(item_id, updated)
-            self._load_table()
+            if self.rm.update(item_id, updated):
+                self._set_row(self.table.currentRow(), updated)
 
     def _toggle_item(self):
         item_id = self._selected_id()
         if item_id is None:
             return
-        self.rm.toggle_active(item_id)
-        self._load_table()
+        if self.rm.toggle_active(item_id):
+            self._set_status(self.table.currentRow(), self.rm.get(item_id))
 
     def _delete_item(self):
         item_id = self._selected_id()
@@ -347,5 +367,5 @@ class RecurringDialog(QDialog):
             QMessageBox.StandardButton.No,
         )
         if reply == QMessageBox.StandardButton.Yes:
-            self.rm.delete(item_id)
-            self._load_table()
+            if self.rm.delete(item_id):
+                self.table.removeRow(self.table.currentRow())
@@ -3,14 +3,16 @@ CashMonitor – Savings Goals Dialog
 Manage savings goals and track progress.
 """
 
+from functools import lru_cache
+
 from PySide6.QtWidgets import (
+    QApplication,
     QDialog,
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QHeaderView,
     QAbstractItemView,
     QFrame,
@@ -18,10 +20,11 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QFormLayout,
     QMessageBox,
-    QProgressBar,
+    QStyle,
+    QStyledItemDelegate,
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont, QColor
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QRectF
+from PySide6.QtGui import QFont, QColor, QPainter
 
 from data_manager import (
     SavingsManager,
@@ -31,6 +34,202 @@ from data_manager import (
 )
 from transaction_dialog import TransactionDialog
 
+# Shared colour objects and alignments, built once instead of per table cell
+_COL_REACHED = QColor("#fbbf24")  # Gold
+_COL_RUNNING = QColor("#94a3b8")
+_COL_BAR_GROOVE = QColor("#233554")
+_COL_PROGRESS_TEXT = QColor("#cbd5e1")
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+
+# Savings categories listed first in the goal dialog's category combo
+SAVINGS_CATEGORIES = [c for c in EXPENSE_CATEGORIES if c.startswith("Sparen")]
+
+# Swaps the separators of format(..., ",.2f") into German: 1,234.56 → 1.234,56
+_DE_NUMBER = str.maketrans({",": ".", ".": ","})
+
+# Height of the progress bar drawn above the amounts
+_BAR_HEIGHT = 8
+
+# Widget stylesheets
+_TITLE_QSS = "color: #4cc9f0;"
+_INFO_QSS = "color: #8892b0; font-size: 11px;"
+_SEP_QSS = "color: #0f3460;"
+
+
+@lru_cache(maxsize=None)
+def _title_font(point_size: int) -> QFont:
+    """Return a bold dialog title font (built after QApplication)."""
+    font = QFont()
+    font.setPointSize(point_size)
+    font.setBold(True)
+    return font
+
+
+@lru_cache(maxsize=None)
+def _progress_font() -> QFont:
+    """Return the small font for the progress amounts (built after QApplication)."""
+    font = QFont()
+    font.setPixelSize(10)
+    return font
+
+
+@lru_cache(maxsize=64)
+def _qcolor(name: str) -> QColor:
+    """Return a shared QColor for a goal's hex colour."""
+    return QColor(name)
+
+
+class SavingsGoalsModel(QAbstractTableModel):
+    """Table model over the savings goals and the amount saved for each."""
+
+    HEADERS = ["Icon", "Name", "Kategorie", "Fortschritt / Ziel", "Status"]
+    # (current, target, colour) for the progress column's delegate
+    PROGRESS_ROLE = Qt.ItemDataRole.UserRole + 1
+    # Rows handed to the view at a time; the view fetches more as it scrolls
+    FETCH_BATCH = 50
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._goals: list[SavingsGoal] = []
+        self._current: list[float] = []
+        self._loaded = 0
+
+    def set_goals(self, goals: list[SavingsGoal], current: list[float]):
+        """Replace all rows; current holds the saved amount per goal."""
+        self.beginResetModel()
+        self._goals = list(goals)
+        self._current = list(current)
+        self._loaded = min(len(self._goals), self.FETCH_BATCH)
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._goals)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(len(self._goals) - self._loaded, self.FETCH_BATCH)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def append_goal(self, goal: SavingsGoal, current: float):
+        if self._loaded < len(self._goals):
+            # Not all rows are shown yet; the new one arrives with fetchMore
+            self._goals.append(goal)
+            self._current.append(current)
+            return
+        row = self._loaded
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._goals.append(goal)
+        self._current.append(current)
+        self._loaded += 1
+        self.endInsertRows()
+
+    def update_goal(self, row: int, goal: SavingsGoal, current: float):
+        self._goals[row] = goal
+        self._current[row] = current
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+
+    def update_category(self, category: str, current: float):
+        """Set the saved amount of all goals linked to category."""
+        for row, goal in enumerate(self._goals):
+            if goal.category == category:
+                self._current[row] = current
+                if row < self._loaded:
+                    self.dataChanged.emit(self.index(row, 3), self.index(row, 4))
+
+    def remove_goal(self, row: int):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._goals[row]
+        del self._current[row]
+        self._loaded -= 1
+        self.endRemoveRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        goal = self._goals[row]
+        current = self._current[row]
+        col = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if col == 0:
+                return goal.icon
+            if col == 1:
+                return goal.name
+            if col == 2:
+                return goal.category
+            if col == 3:
+                percent = 0
+                if goal.target_amount > 0:
+                    percent = int((current / goal.target_amount) * 100)
+                amounts = f"{current:,.2f} / {goal.target_amount:,.2f}".translate(_DE_NUMBER)
+                return f"{amounts} EUR ({percent}%)"
+            return "Erreicht! 🎉" if current >= goal.target_amount else "Laeuft"
+
+        if role == self.PROGRESS_ROLE:
+            return current, goal.target_amount, _qcolor(goal.color)
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if col in (0, 3, 4):
+                return _ALIGN_CENTER
+            return None
+
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if col == 4:
+                return _COL_REACHED if current >= goal.target_amount else _COL_RUNNING
+            return None
+
+        return None
+
+
+class ProgressDelegate(QStyledItemDelegate):
+    """Paints the progress column as a thin bar with the amounts below it."""
+
+    def paint(self, painter, option, index):
+        widget = option.widget
+        style = widget.style() if widget is not None else QApplication.style()
+        # Row background and selection as for any other cell
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, option, painter, widget)
+
+        current, target, color = index.data(SavingsGoalsModel.PROGRESS_ROLE)
+        percent = int((current / target) * 100) if target > 0 else 0
+
+        rect = option.rect.adjusted(8, 8, -8, -4)
+        bar = QRectF(rect.x(), rect.y(), rect.width(), _BAR_HEIGHT)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(_COL_BAR_GROOVE)
+        painter.drawRoundedRect(bar, 2, 2)
+        if percent > 0:
+            bar.setWidth(bar.width() * min(100, percent) / 100)
+            painter.setBrush(color)
+            painter.drawRoundedRect(bar, 2, 2)
+
+        painter.setPen(_COL_PROGRESS_TEXT)
+        painter.setFont(_progress_font())
+        text_rect = rect.adjusted(0, _BAR_HEIGHT + 2, 0, 0)
+        painter.drawText(text_rect, _ALIGN_CENTER, index.data(Qt.ItemDataRole.DisplayRole))
+        painter.restore()
+
+
 class SavingsGoalDialog(QDialog):
     """Dialog to add or edit a single savings goal."""
 
@@ -40,6 +239,9 @@ class SavingsGoalDialog(QDialog):
         self.setFixedSize(400, 300)
         self.setModal(True)
         self._goal = goal
+        # Validated input, set by _on_save and used by get_goal
+        self._name = ""
+        self._amount = 0.0
         self._setup_ui()
         if goal:
             self._populate(goal)
@@ -51,16 +253,13 @@ class SavingsGoalDialog(QDialog):
 
         title_text = "Sparziel bearbeiten" if self._goal else "Neues Sparziel"
         title = QLabel(title_text)
-        title_font = QFont()
-        title_font.setPointSize(14)
-        title_font.setBold(True)
-        title.setFont(title_font)
-        title.setStyleSheet("color: #4cc9f0;")
+        title.setFont(_title_font(14))
+        title.setStyleSheet(_TITLE_QSS)
         layout.addWidget(title)
 
         sep = QFrame()
         sep.setFrameShape(QFrame.Shape.HLine)
-        sep.setStyleSheet("color: #0f3460;")
+        sep.setStyleSheet(_SEP_QSS)
         layout.addWidget(sep)
 
         form = QFormLayout()
@@ -80,7 +279,7 @@ class SavingsGoalDialog(QDialog):
         self.category_combo = QComboBox()
         self.category_combo.setEditable(True)
         # Pre-fill with existing expense categories, but intended for "Sparen: ..."
-        self.category_combo.addItems([c for c in EXPENSE_CATEGORIES if c.startswith("Sparen")])
+        self.category_combo.addItems(SAVINGS_CATEGORIES)
         self.category_combo.addItems(EXPENSE_CATEGORIES)
         form.addRow("Kategorie:", self.category_combo)
 
@@ -102,11 +301,7 @@ class SavingsGoalDialog(QDialog):
         btn_layout.addWidget(cancel_btn)
 
         save_btn = QPushButton("Speichern")
-        save_btn.setStyleSheet(
-            "QPushButton { background-color: #064e3b; border-color: #10b981; "
-            "color: #6ee7b7; font-weight: bold; padding: 8px 24px; border-radius: 8px; }"
-            "QPushButton:hover { background-color: #065f46; }"
-        )
+        save_btn.setObjectName("saveBtn")
         save_btn.clicked.connect(self._on_save)
         btn_layout.addWidget(save_btn)
 
@@ -123,7 +318,8 @@ class SavingsGoalDialog(QDialog):
         self.icon_edit.setText(goal.icon)
 
     def _on_save(self):
-        if not self.name_edit.text().strip():
+        name = self.name_edit.text().strip()
+        if not name:
             QMessageBox.warning(self, "Fehler", "Bitte einen Namen eingeben.")
             return
         try:
@@ -134,12 +330,14 @@ class SavingsGoalDialog(QDialog):
             QMessageBox.warning(self, "Fehler", "Bitte einen gueltigen Zielbetrag eingeben.")
             return
 
+        self._name = name
+        self._amount = amount
         self.accept()
 
     def get_goal(self) -> SavingsGoal:
         return SavingsGoal(
-            name=self.name_edit.text().strip(),
-            target_amount=float(self.amount_edit.text().replace(",", ".")),
+            name=self._name,
+            target_amount=self._amount,
             category=self.category_combo.currentText().strip(),
             icon=self.icon_edit.text().strip() or "💰",
             color="#10b981" # Default green for now
@@ -156,6 +354,9 @@ class SavingsDialog(QDialog):
         self.current_year = year
         self.current_month = month
         self.on_change = on_change
+        self._deposit_dlg = None
+        # Set when a reload was skipped while hidden, see showEvent
+        self._dirty = False
         
         self.setWindowTitle("Sparziele verwalten")
         self.setMinimumSize(800, 500)
@@ -171,11 +372,8 @@ class SavingsDialog(QDialog):
         # Header
         header_layout = QHBoxLayout()
         title = QLabel("Sparziele (Savings Goals)")
-        title_font = QFont()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title.setFont(title_font)
-        title.setStyleSheet("color: #4cc9f0;")
+        title.setFont(_title_font(16))
+        title.setStyleSheet(_TITLE_QSS)
         header_layout.addWidget(title)
         header_layout.addStretch()
         layout.addLayout(header_layout)
@@ -184,26 +382,33 @@ class SavingsDialog(QDialog):
             "Definiere Ziele und verknuepfe sie mit einer Kategorie. "
             "Alle Ausgaben in dieser Kategorie (ueber alle Monate) zaehlen als Fortschritt."
         )
-        info.setStyleSheet("color: #8892b0; font-size: 11px;")
+        info.setStyleSheet(_INFO_QSS)
         info.setWordWrap(True)
         layout.addWidget(info)
 
         sep = QFrame()
         sep.setFrameShape(QFrame.Shape.HLine)
-        sep.setStyleSheet("color: #0f3460;")
+        sep.setStyleSheet(_SEP_QSS)
         layout.addWidget(sep)
 
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Icon", "Name", "Kategorie", "Fortschritt / Ziel", "Status"])
-        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
-        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
-        self.table.setColumnWidth(0, 50)
+        self.model = SavingsGoalsModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self._progress_delegate = ProgressDelegate(self.table)
+        self.table.setItemDelegateForColumn(3, self._progress_delegate)
+        # Fixed starting widths; only the progress column takes the spare space
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
+        header.setSectionResizeMode(3, QHeaderView.ResizeMode.Stretch)
+        for col, width in ((0, 50), (1, 180), (2, 160), (4, 100)):
+            self.table.setColumnWidth(col, width)
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setDefaultSectionSize(50)
         self.table.setAlternatingRowColors(True)
         layout.addWidget(self.table, 1)
 
@@ -211,11 +416,7 @@ class SavingsDialog(QDialog):
         btn_layout = QHBoxLayout()
 
         add_btn = QPushButton("+ Neues Ziel")
-        add_btn.setStyleSheet(
-            "QPushButton { background-color: #064e3b; border-color: #10b981; "
-            "color: #6ee7b7; font-weight: bold; padding: 8px 16px; border-radius: 8px; }"
-            "QPushButton:hover { background-color: #065f46; }"
-        )
+        add_btn.setObjectName("addItemBtn")
         add_btn.clicked.connect(self._add_goal)
         btn_layout.addWidget(add_btn)
 
@@ -226,140 +427,85 @@ class SavingsDialog(QDialog):
         deposit_btn = QPushButton("💰 Einzahlen...")
         deposit_btn.setToolTip("Erstellt eine Ausgabe in der Ziel-Kategorie im aktuellen Monat")
         deposit_btn.clicked.connect(self._deposit)
-        deposit_btn.setStyleSheet(
-            "QPushButton { background-color: #1e3a8a; border-color: #3b82f6; "
-            "color: #93c5fd; font-weight: bold; padding: 8px 16px; border-radius: 8px; }"
-            "QPushButton:hover { background-color: #1e40af; }"
-        )
+        deposit_btn.setObjectName("depositBtn")
         btn_layout.addWidget(deposit_btn)
 
         btn_layout.addStretch()
 
         delete_btn = QPushButton("Loeschen")
-        delete_btn.setStyleSheet(
-            "QPushButton { background-color: #7f1d1d; border-color: #ef4444; "
-            "color: #fca5a5; padding: 8px 16px; border-radius: 8px; }"
-            "QPushButton:hover { background-color: #991b1b; }"
-        )
+        delete_btn.setObjectName("removeItemBtn")
         delete_btn.clicked.connect(self._delete_goal)
         btn_layout.addWidget(delete_btn)
 
         layout.addLayout(btn_layout)
 
-    def _load_table(self):
-        self.table.setRowCount(0)
-        for goal in self.sm.goals:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            # Icon
-            icon_item = QTableWidgetItem(goal.icon)
-            icon_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            icon_item.setData(Qt.ItemDataRole.UserRole, goal.id)
-            self.table.setItem(row, 0, icon_item)
-
-            # Name
-            self.table.setItem(row, 1, QTableWidgetItem(goal.name))
-
-            # Category
-            self.table.setItem(row, 2, QTableWidgetItem(goal.category))
-
-            # Progress
-            # Calculate current amount
-            current = self.dm.get_total_expenses_for_category(goal.category)
-            percent = 0
-            if goal.target_amount > 0:
-                percent = int((current / goal.target_amount) * 100)
-            
-            # Use a custom widget for progress bar + text
-            prog_widget = QFrame()
-            prog_layout = QVBoxLayout(prog_widget)
-            prog_layout.setContentsMargins(4, 4, 4, 4)
-            prog_layout.setSpacing(2)
-            
-            pbar = QProgressBar()
-            pbar.setRange(0, 100)
-            pbar.setValue(min(100, percent))
-            pbar.setTextVisible(False)
-            pbar.setFixedHeight(8)
-            # Style the chunk
-            pbar.setStyleSheet(f"QProgressBar::chunk {{ background-color: {goal.color}; border-radius: 2px; }}")
-            
-            label = QLabel(f"{current:,.2f} / {goal.target_amount:,.2f} EUR ({percent}%)".replace(",", "X").replace(".", ",").replace("X", "."))
-            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            label.setStyleSheet("font-size: 10px; color: #cbd5e1;")
-            
-            prog_layout.addWidget(pbar)
-            prog_layout.addWidget(label)
-            
-            self.table.setCellWidget(row, 3, prog_widget)
-
-            # Status (Completed?)
-            status_text = "Erreicht! 🎉" if current >= goal.target_amount else "Laeuft"
-            status_item = QTableWidgetItem(status_text)
-            if current >= goal.target_amount:
-                status_item.setForeground(QColor("#fbbf24")) # Gold
-            else:
-                status_item.setForeground(QColor("#94a3b8"))
-            status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 4, status_item)
-            
-            self.table.setRowHeight(row, 50) 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._dirty:
+            self._dirty = False
+            self._load_table()
 
-    def _selected_id(self):
-        row = self.table.currentRow()
-        if row < 0:
+    def _load_table(self):
+        if not self.isVisible():
+            self._dirty = True
+            return
+        goals = self.sm.goals
+        # One pass over the category index for all goals
+        totals = self.dm.get_expense_totals_by_category()
+        current = [totals.get(goal.category, 0.0) for goal in goals]
+        self.model.set_goals(goals, current)
+
+    def _selected_row(self) -> int:
+        # Model rows are kept in sm.goals order, so the row is the goal's index
+        rows = self.table.selectionModel().selectedRows()
+        if not rows:
             QMessageBox.information(self, "Hinweis", "Bitte ein Ziel auswaehlen.")
-            return None
-        return self.table.item(row, 0).data(Qt.ItemDataRole.UserRole)
+            return -1
+        return rows[0].row()
 
     def _add_goal(self):
         dlg = SavingsGoalDialog(self)
         if dlg.exec() == QDialog.DialogCode.Accepted:
-            self.sm.add(dlg.get_goal())
-            self._load_table()
+            goal = dlg.get_goal()
+            self.sm.add(goal)
+            self.model.append_goal(goal, self.dm.get_total_expenses_for_category(goal.category))
 
     def _edit_goal(self):
-        goal_id = self._selected_id()
-        if not goal_id: return
-        
-        goal = next((g for g in self.sm.goals if g.id == goal_id), None)
-        if not goal: return
+        row = self._selected_row()
+        if row < 0: return
+        goal = self.sm.goals[row]
 
         dlg = SavingsGoalDialog(self, goal)
         if dlg.exec() == QDialog.DialogCode.Accepted:
             updated = dlg.get_goal()
-            self.sm.update(goal_id, updated)
-            self._load_table()
+            if self.sm.update(goal.id, updated):
+                current = self.dm.get_total_expenses_for_category(updated.category)
+                self.model.update_goal(row, updated, current)
 
     def _delete_goal(self):
-        goal_id = self._selected_id()
-        if not goal_id: return
-        
+        row = self._selected_row()
+        if row < 0: return
+
         reply = QMessageBox.question(
             self, "Loeschen", "Sparziel wirklich loeschen?\n(Die Kategorien/Ausgaben bleiben erhalten.)",
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No
         )
         if reply == QMessageBox.StandardButton.Yes:
-            self.sm.delete(goal_id)
-            self._load_table()
+            self.sm.delete(self.sm.goals[row].id)
+            self.model.remove_goal(row)
 
     def _deposit(self):
-        goal_id = self._selected_id()
-        if not goal_id: return
-        
-        goal = next((g for g in self.sm.goals if g.id == goal_id), None)
-        if not goal: return
-        
-        # Open Transaction Dialog presetting the category
-        dlg = TransactionDialog(self, tx_type="expense")
-        # Pre-fill category
-        idx = dlg.category_combo.findText(goal.category)
-        if idx >= 0:
-            dlg.category_combo.setCurrentIndex(idx)
-        else:
-            dlg.category_combo.setEditText(goal.category)
-            
+        row = self._selected_row()
+        if row < 0: return
+        goal = self.sm.goals[row]
+
+        # Open Transaction Dialog presetting the category; one instance is
+        # kept and reset for every deposit
+        if self._deposit_dlg is None:
+            self._deposit_dlg = TransactionDialog(self, tx_type="expense")
+        dlg = self._deposit_dlg
+        dlg.reset(goal.category)
+
         if dlg.exec() == QDialog.DialogCode.Accepted:
             new_tx = dlg.get_transaction()
             # If date was changed in dialog, we should respect it?
@@ -373,14 +519,15 @@ class SavingsDialog(QDialog):
             # But here we probably want to deposit "now" or for the "current month".
             
             # Let's check new_tx.date
-            y, m, d = map(int, new_tx.date.split("-"))
+            y, m, d = new_tx.ymd
             
             # Load the sheet for that date
             sheet = self.dm.load_month(y, m)
             self.dm.add_transaction(sheet, new_tx)
             
-            # Reload table to show progress
-            self._load_table()
+            # Refresh progress of every goal tracking the booked category
+            category = new_tx.category
+            self.model.update_category(category, self.dm.get_total_expenses_for_category(category))
             
             # Notify parent if the changed month is the one currently viewed
             if self.on_change and y == self.current_year and m == self.current_month:
@@ -3,6 +3,9 @@ CashMonitor – Transaction Dialog
 Dialog for adding or editing a transaction.
 """
 
+from functools import lru_cache
+from typing import Optional
+
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -17,7 +20,7 @@ from PySide6.QtWidgets import (
     QDialogButtonBox,
     QFrame,
 )
-from PySide6.QtCore import QDate, Qt
+from PySide6.QtCore import QDate, Qt, QStringListModel
 from PySide6.QtGui import QFont
 
 from data_manager import (
@@ -26,6 +29,29 @@ from data_manager import (
     INCOME_CATEGORIES,
 )
 
+# Widget stylesheets
+_HEADER_QSS = {
+    "income": "color: #10b981; padding-bottom: 8px;",
+    "expense": "color: #ef4444; padding-bottom: 8px;",
+}
+_SEP_QSS = "color: #0f3460;"
+
+
+@lru_cache(maxsize=None)
+def _header_font() -> QFont:
+    """Return the dialog header font (built after QApplication)."""
+    font = QFont()
+    font.setPointSize(16)
+    font.setBold(True)
+    return font
+
+
+@lru_cache(maxsize=None)
+def _category_model(tx_type: str) -> QStringListModel:
+    """Return the category list model shared by all dialogs of one type."""
+    categories = INCOME_CATEGORIES if tx_type == "income" else EXPENSE_CATEGORIES
+    return QStringListModel(categories)
+
 
 class TransactionDialog(QDialog):
     """Dialog for adding or editing a transaction."""
@@ -60,20 +86,14 @@ class TransactionDialog(QDialog):
         header = QLabel(
             "💰 Einnahme" if self.tx_type == "income" else "💸 Ausgabe"
         )
-        header_font = QFont()
-        header_font.setPointSize(16)
-        header_font.setBold(True)
-        header.setFont(header_font)
-        header.setStyleSheet(
-            f"color: {'#10b981' if self.tx_type == 'income' else '#ef4444'}; "
-            f"padding-bottom: 8px;"
-        )
+        header.setFont(_header_font())
+        header.setStyleSheet(_HEADER_QSS.get(self.tx_type, _HEADER_QSS["expense"]))
         layout.addWidget(header)
 
         # Separator
         sep = QFrame()
         sep.setFrameShape(QFrame.Shape.HLine)
-        sep.setStyleSheet("color: #0f3460;")
+        sep.setStyleSheet(_SEP_QSS)
         layout.addWidget(sep)
 
         # Form
@@ -90,8 +110,8 @@ class TransactionDialog(QDialog):
 
         # Category
         self.category_combo = QComboBox()
-        categories = INCOME_CATEGORIES if self.tx_type == "income" else EXPENSE_CATEGORIES
-        self.category_combo.addItems(categories)
+        # NoInsert below keeps typed categories out of the shared model
+        self.category_combo.setModel(_category_model(self.tx_type))
         self.category_combo.setEditable(True)
         self.category_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
         form.addRow("Kategorie:", self.category_combo)
@@ -126,17 +146,7 @@ class TransactionDialog(QDialog):
 
         save_btn = QPushButton("💾 Speichern")
         save_btn.setDefault(True)
-        save_btn.setStyleSheet(
-            "QPushButton { "
-            f"  background-color: {'#064e3b' if self.tx_type == 'income' else '#7f1d1d'}; "
-            f"  border-color: {'#10b981' if self.tx_type == 'income' else '#ef4444'}; "
-            f"  color: {'#6ee7b7' if self.tx_type == 'income' else '#fca5a5'}; "
-            "  font-weight: bold; padding: 8px 24px; border-radius: 8px; "
-            "} "
-            "QPushButton:hover { "
-            f"  background-color: {'#065f46' if self.tx_type == 'income' else '#991b1b'}; "
-            "}"
-        )
+        save_btn.setObjectName("saveBtn" if self.tx_type == "income" else "saveExpenseBtn")
         save_btn.clicked.connect(self._on_save)
         btn_layout.addWidget(save_btn)
 
@@ -145,15 +155,10 @@ class TransactionDialog(QDialog):
     def _populate(self, tx: Transaction):
         """Fill in fields from existing transaction."""
         # Date
-        parts = tx.date.split("-")
-        self.date_edit.setDate(QDate(int(parts[0]), int(parts[1]), int(parts[2])))
+        self.date_edit.setDate(QDate(*tx.ymd))
 
         # Category
-        idx = self.category_combo.findText(tx.category)
-        if idx >= 0:
-            self.category_combo.setCurrentIndex(idx)
-        else:
-            self.category_combo.setEditText(tx.category)
+        self._select_category(tx.category)
 
         # Amount
         self.amount_spin.setValue(tx.amount)
@@ -161,6 +166,23 @@ class TransactionDialog(QDialog):
         # Description
         self.desc_edit.setText(tx.description)
 
+    def _select_category(self, category: str):
+        idx = self.category_combo.findText(category)
+        if idx >= 0:
+            self.category_combo.setCurrentIndex(idx)
+        else:
+            self.category_combo.setEditText(category)
+
+    def reset(self, category: Optional[str] = None):
+        """Clear the fields for a new entry so the dialog can be shown again."""
+        self.date_edit.setDate(QDate.currentDate())
+        self.amount_spin.setValue(0.00)
+        self.desc_edit.clear()
+        if category is not None:
+            self._select_category(category)
+        else:
+            self.category_combo.setCurrentIndex(0)
+
     def _on_save(self):
         """Validate and accept."""
         if self.amount_spin.value() <= 0:
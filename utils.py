@@ -1,7 +1,21 @@
-
+import json
+import mmap
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is used otherwise
+    orjson = None
+
+# Files above this size are memory-mapped for orjson instead of copied
+# into a bytes object; below it the mmap setup costs more than it saves.
+_MMAP_THRESHOLD = 64 * 1024
+
+
+@lru_cache(maxsize=1)
 def get_app_dir() -> Path:
     """
     Return the base directory for the application.
@@ -11,3 +25,46 @@ def get_app_dir() -> Path:
     if getattr(sys, 'frozen', False):
         return Path(sys.executable).parent
     return Path(__file__).parent
+
+
+def parse_json(data: bytes):
+    """Parse UTF-8 encoded JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json(path: Path):
+    """Read and parse a UTF-8 JSON file."""
+    if orjson is not None and path.stat().st_size > _MMAP_THRESHOLD:
+        with open(path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    return orjson.loads(view)
+    return parse_json(path.read_bytes())
+
+
+def write_bytes_atomic(path: Path, data: bytes) -> None:
+    """
+    Replace the file at path with data.
+    The data goes to a temporary file first and is then renamed over
+    path, so readers never see a partially written file. The data is
+    synced before the rename so a crash cannot leave an empty file behind.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    # Unbuffered: the payload is already complete in memory
+    with open(tmp_path, "wb", buffering=0) as f:
+        view = memoryview(data)
+        while view:
+            view = view[f.write(view):]
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def write_json(path: Path, obj) -> None:
+    """Atomically write obj as indented UTF-8 JSON."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    write_bytes_atomic(path, data)